@@ -43,7 +43,10 @@ from src.trading_execution_engine.monitoring.performance_tracker import (
     ExecutionPerformanceTracker,
 )
 from src.trading_execution_engine.risk.manager import RiskManager
-from src.trading_execution_engine.utils.logger import get_logger
+from src.trading_execution_engine.utils.logger import (
+    configure_package_logging,
+    get_logger,
+)
 from src.trading_execution_engine.utils.market_hours import MarketHoursValidator
 
 logger = get_logger(__name__)
@@ -180,7 +183,7 @@ class DailyTradingScheduler:
         logger.info("Running pre-market setup")
 
         # Initialize risk limits for the day
-        await self.risk_manager.reset_daily_limits()
+        self.risk_manager.reset_daily_limits()
 
         # Prepare paper trading portfolio
         await self.paper_trader.initialize_daily_session()
@@ -218,15 +221,36 @@ class DailyTradingScheduler:
             # Process each signal
             for signal in signals:
                 # Risk validation
-                if not await self.risk_manager.validate_signal(signal):
+                if not self.risk_manager.validate_signal(signal):
                     cycle_result["risk_violations"] += 1
                     continue
 
                 # Execute paper trade
                 if self.config["paper_trading"]["enabled"]:
-                    paper_result = await self.paper_trader.execute_signal(signal)
+                    execution_data = {
+                        "signal_id": signal.get("signal_id"),
+                        "execution_type": "paper",
+                        "symbol": signal.get("symbol"),
+                        "action": signal.get("action"),
+                        "quantity": signal.get("quantity", 0),
+                        "expected_price": signal.get("price", 0),
+                    }
+                    with self.performance_tracker.time_execution(execution_data):
+                        paper_result = await self.paper_trader.execute_signal(signal)
                     if paper_result["executed"]:
                         cycle_result["paper_trades"] += 1
+                        execution_price = paper_result["execution_price"]
+                        execution_data.update(
+                            execution_id=paper_result["trade_id"],
+                            execution_price=execution_price,
+                            slippage=abs(
+                                execution_price - execution_data["expected_price"]
+                            )
+                            * execution_data["quantity"],
+                            commission=self.paper_trader.commission_per_trade,
+                            pnl=paper_result["pnl"],
+                        )
+                        self.performance_tracker.track_execution(execution_data)
 
                 # Present for manual execution
                 if self.config["manual_trading"]["enabled"]:
@@ -235,7 +259,7 @@ class DailyTradingScheduler:
                         cycle_result["manual_trades"] += 1
 
                 # Track performance
-                await self.performance_tracker.track_signal(
+                self.performance_tracker.track_signal(
                     signal,
                     {
                         "paper_result": (
@@ -299,7 +323,7 @@ class DailyTradingScheduler:
         performance["manual_trading"] = manual_summary
 
         # Risk management summary
-        risk_summary = await self.risk_manager.generate_daily_summary()
+        risk_summary = self.risk_manager.generate_daily_summary()
         performance["risk_management"] = risk_summary
 
         # Save performance data
@@ -318,8 +342,7 @@ class DailyTradingScheduler:
             date_str = datetime.now().strftime("%Y%m%d")
             output_file = output_dir / f"trading_performance_{date_str}.json"
 
-            with open(output_file, "w") as f:
-                json.dump(performance, f, indent=2, default=str)
+            output_file.write_bytes(await self.performance_tracker.to_json(performance))
 
             logger.info(f"Daily performance saved to {output_file}")
 
@@ -343,6 +366,7 @@ def main():
 
     args = parser.parse_args()
 
+    configure_package_logging()
     scheduler = DailyTradingScheduler(config_path=args.config)
 
     if args.dry_run:
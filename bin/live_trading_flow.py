@@ -18,6 +18,8 @@ from typing import Any, Optional
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.trading_execution_engine.utils.logger import configure_package_logging
+
 try:
     from flow.delta_data_pull import DeltaDataPuller
 
@@ -433,6 +435,7 @@ def main():
     )
 
     args = parser.parse_args()
+    configure_package_logging()
 
     if not args.force_enable:
         print("🚫 Live trading is DISABLED by default for SEBI compliance")
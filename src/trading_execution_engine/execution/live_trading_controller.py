@@ -19,18 +19,24 @@ Licensed by SJ Trading
 
 import asyncio
 import json
+import logging
 import os
 import signal
+import time
 from datetime import datetime, timedelta
 from enum import Enum
+from pathlib import Path
 from typing import Any, Optional
 
 from ..ingest.kite_loader import KiteDataLoader, LiveTradingEngine
-from ..utils.logger import setup_logger
+from ..utils.logger import configure_package_logging, setup_logger
 from .dry_run_trading_engine import DryRunTradingEngine
 
 logger = setup_logger(__name__)
 
+# Minimum seconds between periodic status logs in the trading loop
+STATUS_LOG_INTERVAL = 30.0
+
 
 class TradingMode(Enum):
     """Trading execution modes."""
@@ -51,6 +57,15 @@ class TradingStatus(Enum):
     ERROR = "error"
 
 
+class StrategyLogAdapter(logging.LoggerAdapter):
+    """Logger adapter that tags records with their symbol and strategy."""
+
+    def process(self, msg: Any, kwargs: Any) -> tuple[Any, Any]:
+        msg, kwargs = super().process(msg, kwargs)
+        extra = self.extra or {}
+        return f"{extra['symbol']}:{extra['strategy']} - {msg}", kwargs
+
+
 class LiveTradingController:
     """
     Main controller for live trading operations.
@@ -59,6 +74,30 @@ class LiveTradingController:
     to order placement, risk management, and performance monitoring.
     """
 
+    __slots__ = (
+        "mode",
+        "_mode_value",
+        "_is_dry_run",
+        "_is_live",
+        "initial_capital",
+        "_status",
+        "_status_value",
+        "config",
+        "kite_loader",
+        "dry_run_engine",
+        "live_engine",
+        "active_symbols",
+        "is_running",
+        "start_time",
+        "total_trades",
+        "successful_trades",
+        "total_pnl",
+        "emergency_stop",
+        "circuit_breaker_triggered",
+        "_last_log_ts",
+        "_strategy_loggers",
+    )
+
     def __init__(
         self,
         mode: TradingMode = TradingMode.DRY_RUN,
@@ -74,6 +113,10 @@ class LiveTradingController:
             config_path: Path to trading configuration file
         """
         self.mode = mode
+        # The mode is fixed for the session, so resolve enum checks once
+        self._mode_value = mode.value
+        self._is_dry_run = mode == TradingMode.DRY_RUN
+        self._is_live = mode == TradingMode.LIVE
         self.initial_capital = initial_capital
         self.status = TradingStatus.STARTING
 
@@ -99,8 +142,24 @@ class LiveTradingController:
         self.emergency_stop = False
         self.circuit_breaker_triggered = False
 
+        # Monotonic timestamp of the last periodic status log
+        self._last_log_ts = 0.0
+
+        # Per (symbol, strategy) log adapters, reused across trading cycles
+        self._strategy_loggers: dict[tuple[str, str], StrategyLogAdapter] = {}
+
         logger.info("Live Trading Controller initialized in {mode.value} mode")
 
+    @property
+    def status(self) -> TradingStatus:
+        """Current trading system status."""
+        return self._status
+
+    @status.setter
+    def status(self, status: TradingStatus) -> None:
+        self._status = status
+        self._status_value = status.value
+
     def _load_trading_config(self, config_path: Optional[str]) -> dict[str, Any]:
         """Load trading configuration."""
         default_config = {
@@ -112,6 +171,12 @@ class LiveTradingController:
                 "max_drawdown": 0.10,
                 "max_concentration": 0.25,
             },
+            "auth": {
+                # Optional file an automated deployment can drop the Kite
+                # request_token into instead of typing it on stdin
+                "request_token_file": os.getenv("KITE_REQUEST_TOKEN_FILE"),
+                "request_token_timeout": 300,  # seconds
+            },
             "trading_hours": {
                 "start": "09:15",
                 "end": "15:30",
@@ -157,7 +222,7 @@ class LiveTradingController:
                 print("\n🌐 Please visit: {login_url}")
                 print("After login, copy the 'request_token' from the URL")
 
-                request_token = input("Enter request_token: ").strip()
+                request_token = await self._wait_for_request_token()
                 if request_token:
                     access_token = self.kite_loader.authenticate(request_token)
                     if not access_token:
@@ -173,13 +238,13 @@ class LiveTradingController:
             logger.info("✅ Loaded {len(instruments)} instruments")
 
             # Initialize trading engine based on mode
-            if self.mode == TradingMode.DRY_RUN:
+            if self._is_dry_run:
                 self.dry_run_engine = DryRunTradingEngine(
                     self.kite_loader, initial_capital=self.initial_capital
                 )
                 self._register_strategies(self.dry_run_engine)
 
-            elif self.mode == TradingMode.LIVE:
+            elif self._is_live:
                 self.live_engine = LiveTradingEngine(self.kite_loader)
                 # Register strategies for live engine would go here
 
@@ -195,6 +260,43 @@ class LiveTradingController:
             self.status = TradingStatus.ERROR
             return False
 
+    async def _wait_for_request_token(self) -> str:
+        """
+        Obtain the Kite request token without blocking the event loop.
+
+        If a token file is configured it is polled until the token appears
+        (and consumed, since request tokens are single use); otherwise stdin
+        is read in the default executor.
+
+        Returns:
+            The request token, or an empty string if none was provided
+        """
+        auth_config = self.config.get("auth", {})
+        token_file = auth_config.get("request_token_file")
+
+        if not token_file:
+            loop = asyncio.get_running_loop()
+            request_token = await loop.run_in_executor(
+                None, input, "Enter request_token: "
+            )
+            return request_token.strip()
+
+        token_path = Path(token_file)
+        timeout = auth_config.get("request_token_timeout", 300)
+        deadline = time.monotonic() + timeout
+        logger.info("Waiting for request_token in %s", token_path)
+
+        while time.monotonic() < deadline:
+            if token_path.exists():
+                request_token = token_path.read_text().strip()
+                if request_token:
+                    token_path.unlink(missing_ok=True)
+                    return request_token
+            await asyncio.sleep(0.5)
+
+        logger.error("Timed out after %ss waiting for %s", timeout, token_path)
+        return ""
+
     def _register_strategies(self, engine: Any) -> None:
         """Register trading strategies with the engine."""
         try:
@@ -322,10 +424,10 @@ class LiveTradingController:
         violations = {}
 
         try:
-            if self.mode == TradingMode.DRY_RUN and self.dry_run_engine:
+            if self._is_dry_run and self.dry_run_engine:
                 violations = self.dry_run_engine.monitor_risk_limits()
 
-            elif self.mode == TradingMode.LIVE and self.live_engine:
+            elif self._is_live and self.live_engine:
                 # Implement live risk checking
                 pass
 
@@ -371,18 +473,18 @@ class LiveTradingController:
             for symbol in self.active_symbols[:3]:  # Limit to 3 symbols for demo
                 for strategy_name in self.config.get("strategies", []):
                     try:
-                        if self.mode == TradingMode.DRY_RUN and self.dry_run_engine:
+                        if self._is_dry_run and self.dry_run_engine:
                             self.dry_run_engine.execute_strategy_signals(
                                 symbol, strategy_name
                             )
-                        elif self.mode == TradingMode.LIVE and self.live_engine:
+                        elif self._is_live and self.live_engine:
                             self.live_engine.execute_strategy_signals(
                                 symbol, strategy_name
                             )
 
                     except Exception as e:
-                        logger.debug(
-                            "Strategy execution for {symbol}:{strategy_name} - {e}"
+                        self._strategy_logger(symbol, strategy_name).debug(
+                            "Strategy execution failed: %s", e
                         )
 
             # Update performance metrics
@@ -391,10 +493,21 @@ class LiveTradingController:
         except Exception as e:
             logger.error("Trading cycle execution failed: {e}")
 
+    def _strategy_logger(self, symbol: str, strategy_name: str) -> StrategyLogAdapter:
+        """Get the cached log adapter for a symbol/strategy pair."""
+        key = (symbol, strategy_name)
+        adapter = self._strategy_loggers.get(key)
+        if adapter is None:
+            adapter = StrategyLogAdapter(
+                logger, {"symbol": symbol, "strategy": strategy_name}
+            )
+            self._strategy_loggers[key] = adapter
+        return adapter
+
     def _update_performance_metrics(self) -> None:
         """Update performance tracking metrics."""
         try:
-            if self.mode == TradingMode.DRY_RUN and self.dry_run_engine:
+            if self._is_dry_run and self.dry_run_engine:
                 summary = self.dry_run_engine.get_portfolio_summary()
                 self.total_trades = summary.get("trades_executed", 0)
                 self.total_pnl = summary.get("total_pnl", 0.0)
@@ -412,8 +525,8 @@ class LiveTradingController:
         """Get comprehensive status report."""
         report = {
             "timestamp": datetime.now().isoformat(),
-            "mode": self.mode.value,
-            "status": self.status.value,
+            "mode": self._mode_value,
+            "status": self._status_value,
             "uptime": (
                 str(datetime.now() - self.start_time) if self.start_time else "0:00:00"
             ),
@@ -426,11 +539,11 @@ class LiveTradingController:
         }
 
         # Add engine-specific data
-        if self.mode == TradingMode.DRY_RUN and self.dry_run_engine:
+        if self._is_dry_run and self.dry_run_engine:
             portfolio_summary = self.dry_run_engine.get_portfolio_summary()
             report["portfolio"] = portfolio_summary
 
-        elif self.mode == TradingMode.LIVE and self.live_engine:
+        elif self._is_live and self.live_engine:
             # Add live engine status
             report["live_positions"] = len(
                 getattr(self.live_engine, "position_tracker", {})
@@ -477,12 +590,17 @@ class LiveTradingController:
                 # Execute trading cycle
                 await self.execute_trading_cycle()
 
-                # Log status periodically
-                if self.total_trades % 10 == 0:  # Every 10 trades
+                # Log status at most once per status interval
+                now = time.monotonic()
+                if now - self._last_log_ts >= STATUS_LOG_INTERVAL:
                     status = self.get_status_report()
                     logger.info(
-                        "🎯 Status: {status['status']} | P&L: ₹{status['total_pnl']:,.2f} | Trades: {status['total_trades']}"
+                        "🎯 Status: %s | P&L: ₹%.2f | Trades: %s",
+                        status["status"],
+                        status["total_pnl"],
+                        status["total_trades"],
                     )
+                    self._last_log_ts = now
 
                 # Wait before next cycle
                 await asyncio.sleep(update_interval)
@@ -505,7 +623,7 @@ class LiveTradingController:
 
         try:
             # Export final results
-            if self.mode == TradingMode.DRY_RUN and self.dry_run_engine:
+            if self._is_dry_run and self.dry_run_engine:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 log_file = "trading_session_{timestamp}.json"
                 self.dry_run_engine.export_trading_log(log_file)
@@ -577,4 +695,5 @@ if __name__ == "__main__":
     print("Duration: {args.duration} hours")
     print("=" * 60)
 
+    configure_package_logging()
     asyncio.run(main())
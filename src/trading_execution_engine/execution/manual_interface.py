@@ -9,7 +9,11 @@ Licensed by SJ Trading
 """
 
 import asyncio
+import atexit
 import json
+import queue
+import sys
+import threading
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -17,12 +21,89 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Signal displays are written by one shared daemon thread, started on first
+# use, so stdout I/O never stalls the event loop
+_PRINT_QUEUE: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+_printer_thread: Optional[threading.Thread] = None
+_printer_lock = threading.Lock()
+
+
+def _printer():
+    """Write queued signal displays to stdout until the None sentinel"""
+    while (block := _PRINT_QUEUE.get()) is not None:
+        sys.stdout.write(block)
+        sys.stdout.flush()
+
+
+def _print_block(block: str):
+    """Queue a display block, starting the printer thread if needed"""
+    global _printer_thread
+    if _printer_thread is None:
+        with _printer_lock:
+            if _printer_thread is None:
+                _printer_thread = threading.Thread(
+                    target=_printer, name="manual-signal-printer", daemon=True
+                )
+                _printer_thread.start()
+    _PRINT_QUEUE.put(block)
+
+
+@atexit.register
+def _stop_printer():
+    """Drain pending displays and stop the printer thread"""
+    global _printer_thread
+    with _printer_lock:
+        thread, _printer_thread = _printer_thread, None
+    if thread is not None:
+        _PRINT_QUEUE.put(None)
+        thread.join(timeout=5)
+
+
+class _SignalFields(dict):
+    """Signal display fields, defaulting missing keys the way the display expects"""
+
+    _NUMERIC_FIELDS = frozenset(
+        ("price", "quantity", "estimated_value", "stop_loss", "target")
+    )
+
+    def __missing__(self, key: str) -> Any:
+        return 0 if key in self._NUMERIC_FIELDS else "N/A"
+
 
 class ManualExecutionInterface:
     """
     Interface for manual trade execution with SEBI compliance
     """
 
+    __slots__ = (
+        "config",
+        "pending_signals",
+        "executed_trades",
+        "user_confirmations",
+        "require_confirmation",
+        "max_order_value",
+        "cooling_period",
+    )
+
+    _SIGNAL_TEMPLATE = (
+        "\n" + "=" * 60 + "\n"
+        "🚨 NEW TRADING SIGNAL FOR MANUAL EXECUTION\n" + "=" * 60 + "\n"
+        "Signal ID: {signal_id}\n"
+        "Symbol: {symbol}\n"
+        "Action: {action}\n"
+        "Strategy: {strategy}\n"
+        "Signal Strength: {strength}\n"
+        "Recommended Price: ₹{price:,.2f}\n"
+        "Recommended Quantity: {quantity}\n"
+        "Estimated Value: ₹{estimated_value:,.2f}\n"
+        "Stop Loss: ₹{stop_loss:,.2f}\n"
+        "Target: ₹{target:,.2f}\n"
+        "Risk/Reward: {risk_reward_ratio}\n"
+        "\n⚠️  SEBI COMPLIANCE NOTICE:\n"
+        "This is a signal for manual execution only.\n"
+        "Please review and execute manually through your broker.\n" + "=" * 60 + "\n"
+    )
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.pending_signals: List[Dict[str, Any]] = []
@@ -111,24 +192,7 @@ class ManualExecutionInterface:
 
     def _display_signal_for_user(self, signal: Dict[str, Any]):
         """Display signal information for user review"""
-        print("\n" + "=" * 60)
-        print("🚨 NEW TRADING SIGNAL FOR MANUAL EXECUTION")
-        print("=" * 60)
-        print(f"Signal ID: {signal['signal_id']}")
-        print(f"Symbol: {signal.get('symbol', 'N/A')}")
-        print(f"Action: {signal.get('action', 'N/A')}")
-        print(f"Strategy: {signal.get('strategy', 'N/A')}")
-        print(f"Signal Strength: {signal.get('strength', 'N/A')}")
-        print(f"Recommended Price: ₹{signal.get('price', 0):,.2f}")
-        print(f"Recommended Quantity: {signal.get('quantity', 0)}")
-        print(f"Estimated Value: ₹{signal.get('estimated_value', 0):,.2f}")
-        print(f"Stop Loss: ₹{signal.get('stop_loss', 0):,.2f}")
-        print(f"Target: ₹{signal.get('target', 0):,.2f}")
-        print(f"Risk/Reward: {signal.get('risk_reward_ratio', 'N/A')}")
-        print("\n⚠️  SEBI COMPLIANCE NOTICE:")
-        print("This is a signal for manual execution only.")
-        print("Please review and execute manually through your broker.")
-        print("=" * 60)
+        _print_block(self._SIGNAL_TEMPLATE.format_map(_SignalFields(signal)))
 
     async def _simulate_user_decision(self, signal: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -9,24 +9,103 @@ Licensed by SJ Trading
 """
 
 import json
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import math
+import time
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
+from ..utils.columns import grow_columns
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+BUY, SELL = "BUY", "SELL"
+VALID_ACTIONS = (BUY, SELL)
+
+# Action codes used in the columnar trade buffer
+ACTION_CODES = {BUY: 0, SELL: 1}
+
+
+class TradeColumns:
+    """
+    Columnar (structure-of-arrays) buffer of the trade amounts that feed the
+    session aggregates
+
+    Totals are exact NumPy-backed sums over these columns instead of Python
+    passes over a list of dicts; per-action trade counts are kept on append.
+    """
+
+    __slots__ = ("size", "commission", "pnl", "action_counts")
+
+    def __init__(self, capacity: int = 256):
+        self.size = 0
+        self.commission = np.empty(capacity, dtype=np.float64)
+        self.pnl = np.empty(capacity, dtype=np.float64)
+        self.action_counts = [0] * len(ACTION_CODES)  # Maintained on append
+
+    def append(self, action: str, commission: float, pnl: float):
+        """Append one trade, doubling the buffers when full"""
+        if self.size == len(self.pnl):
+            self._grow()
+
+        self.action_counts[ACTION_CODES[action]] += 1
+
+        i = self.size
+        self.commission[i] = commission
+        self.pnl[i] = pnl
+        self.size = i + 1
+
+    def _grow(self):
+        grow_columns(self, ("commission", "pnl"), self.size)
+
+    def count(self, action: str) -> int:
+        """Number of trades with the given action"""
+        return self.action_counts[ACTION_CODES[action]]
+
+    def total(self, column: str) -> float:
+        """Exactly rounded sum of a numeric column over the recorded trades"""
+        return math.fsum(getattr(self, column)[: self.size])
+
+
+def _iso_timestamp(timestamp_ns: int) -> str:
+    """Local-time ISO 8601 string for an epoch timestamp in nanoseconds"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+
+class TradeRecord(dict):
+    """
+    Trade dict whose ISO ``"timestamp"`` is formatted from ``"timestamp_ns"``
+    the first time it is read, so recording a fill skips the datetime work
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, key):
+        if key != "timestamp" or "timestamp_ns" not in self:
+            raise KeyError(key)
+        value = self["timestamp"] = _iso_timestamp(self["timestamp_ns"])
+        return value
+
 
 class PaperTrader:
     """
     Paper trading engine for strategy validation
+
+    Trades are stored as ``TradeRecord`` dicts stamped with ``timestamp_ns``.
+    Their ``"timestamp"`` key is filled in when the record is first indexed
+    for it, or for every trade when a summary or trade history is exported.
     """
 
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.portfolio = {}
         self.trades = []
-        self.daily_pnl = 0.0
+        self.trade_columns = TradeColumns()
+        self._trade_counter = 0
+        self._formatted_trades = 0  # Trades whose ISO timestamp is materialized
+        self._session_date = date.today().isoformat()
         self.initial_capital = config.get("initial_capital", 1000000)
         self.available_capital = self.initial_capital
         self.commission_per_trade = config.get("commission_per_trade", 20)
@@ -36,10 +115,18 @@ class PaperTrader:
             f"Paper trader initialized with capital: ₹{self.initial_capital:,.2f}"
         )
 
+    @property
+    def daily_pnl(self) -> float:
+        """Session P&L, summed exactly over the columnar buffer like commission"""
+        return self.trade_columns.total("pnl")
+
     async def initialize_daily_session(self):
         """Initialize daily paper trading session"""
-        self.daily_pnl = 0.0
         self.trades = []
+        self.trade_columns = TradeColumns()
+        self._trade_counter = 0
+        self._formatted_trades = 0
+        self._session_date = date.today().isoformat()
 
         logger.info("Daily paper trading session initialized")
 
@@ -53,62 +140,140 @@ class PaperTrader:
         quantity = signal.get("quantity", 0)
         price = signal.get("price", 0)
 
-        if not all([symbol, action in ["BUY", "SELL"], quantity > 0, price > 0]):
+        if not symbol or action not in VALID_ACTIONS or quantity <= 0 or price <= 0:
             return {"executed": False, "reason": "Invalid signal parameters"}
 
-        # Apply slippage
+        # Apply slippage: BUY fills above the signal price, SELL below
         slippage_factor = 1 + (self.slippage_bps / 10000)
-        if action == "BUY":
+        if action == BUY:
             execution_price = price * slippage_factor
         else:
             execution_price = price / slippage_factor
 
+        return self._fill_signal(
+            signal, symbol, action, quantity, price, execution_price
+        )
+
+    async def execute_signals_batch(
+        self, signals: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a burst of signals in one call
+
+        Validation and slippage pricing are vectorised across the batch; fills
+        are then applied in order, so capital checks and realized P&L match
+        calling execute_signal for each signal in turn.
+        """
+        if not self.config.get("enabled", True):
+            return [
+                {"executed": False, "reason": "Paper trading disabled"} for _ in signals
+            ]
+
+        if not signals:
+            return []
+
+        symbols = [signal.get("symbol") or "" for signal in signals]
+        actions = np.array([signal.get("action", "").upper() for signal in signals])
+        quantities = np.array([signal.get("quantity", 0) for signal in signals])
+        prices = np.array([signal.get("price", 0) for signal in signals])
+
+        is_buy = actions == BUY
+        valid = (
+            np.array([bool(symbol) for symbol in symbols])
+            & (is_buy | (actions == SELL))
+            & (quantities > 0)
+            & (prices > 0)
+        )
+
+        slippage_factor = 1 + (self.slippage_bps / 10000)
+        execution_prices = np.where(
+            is_buy, prices * slippage_factor, prices / slippage_factor
+        )
+
+        results = []
+        for i, signal in enumerate(signals):
+            if not valid[i]:
+                results.append(
+                    {"executed": False, "reason": "Invalid signal parameters"}
+                )
+                continue
+
+            results.append(
+                self._fill_signal(
+                    signal,
+                    symbols[i],
+                    str(actions[i]),
+                    signal["quantity"],
+                    signal["price"],
+                    float(execution_prices[i]),
+                )
+            )
+
+        return results
+
+    def _fill_signal(
+        self,
+        signal: Dict[str, Any],
+        symbol: str,
+        action: str,
+        quantity: float,
+        price: float,
+        execution_price: float,
+    ) -> Dict[str, Any]:
+        """Fill a validated, slippage-priced signal against the paper portfolio"""
+        is_buy = action == BUY
+        sign = 1.0 if is_buy else -1.0
+
         # Calculate trade value
         trade_value = execution_price * quantity
         total_cost = trade_value + self.commission_per_trade
 
         # Check available capital for BUY orders
-        if action == "BUY" and total_cost > self.available_capital:
+        if is_buy and total_cost > self.available_capital:
             return {
                 "executed": False,
                 "reason": f"Insufficient capital: need ₹{total_cost:,.2f}, have ₹{self.available_capital:,.2f}",
             }
 
         # Execute the trade
-        trade = {
-            "trade_id": f"paper_{len(self.trades) + 1}",
-            "timestamp": datetime.now().isoformat(),
-            "symbol": symbol,
-            "action": action,
-            "quantity": quantity,
-            "signal_price": price,
-            "execution_price": execution_price,
-            "trade_value": trade_value,
-            "commission": self.commission_per_trade,
-            "total_cost": total_cost,
-            "slippage_bps": self.slippage_bps,
-            "signal_data": signal,
-        }
+        self._trade_counter += 1
+        trade = TradeRecord(
+            {
+                "trade_id": f"paper_{self._trade_counter}",
+                "timestamp_ns": time.time_ns(),
+                "symbol": symbol,
+                "action": action,
+                "quantity": quantity,
+                "signal_price": price,
+                "execution_price": execution_price,
+                "trade_value": trade_value,
+                "commission": self.commission_per_trade,
+                "total_cost": total_cost,
+                "slippage_bps": self.slippage_bps,
+                "signal_data": signal,
+            }
+        )
 
         # Update portfolio
         self._update_portfolio(trade)
 
-        # Update available capital
-        if action == "BUY":
-            self.available_capital -= total_cost
-        else:
-            self.available_capital += trade_value - self.commission_per_trade
+        # Update available capital: BUY pays, SELL receives, both pay commission
+        self.available_capital -= sign * trade_value + self.commission_per_trade
 
         # Calculate P&L
         pnl = self._calculate_trade_pnl(trade)
         trade["pnl"] = pnl
-        self.daily_pnl += pnl
 
         self.trades.append(trade)
+        self.trade_columns.append(action, self.commission_per_trade, pnl)
 
         logger.info(
-            f"Paper trade executed: {action} {quantity} {symbol} @ ₹{execution_price:.2f} "
-            f"(P&L: ₹{pnl:.2f})"
+            "Paper trade executed: %s %s %s @ ₹%.2f (P&L: ₹%.2f)",
+            action,
+            quantity,
+            symbol,
+            execution_price,
+            pnl,
         )
 
         return {
@@ -126,17 +291,16 @@ class PaperTrader:
         action = trade["action"]
         quantity = trade["quantity"]
 
-        if symbol not in self.portfolio:
-            self.portfolio[symbol] = {
+        position = self.portfolio.get(symbol)
+        if position is None:
+            position = self.portfolio[symbol] = {
                 "quantity": 0,
                 "avg_price": 0,
                 "total_cost": 0,
                 "realized_pnl": 0,
             }
 
-        position = self.portfolio[symbol]
-
-        if action == "BUY":
+        if action == BUY:
             # Add to position
             total_quantity = position["quantity"] + quantity
             total_cost = position["total_cost"] + trade["total_cost"]
@@ -146,7 +310,7 @@ class PaperTrader:
             position["quantity"] = total_quantity
             position["total_cost"] = total_cost
 
-        elif action == "SELL":
+        elif action == SELL:
             # Reduce position
             if position["quantity"] >= quantity:
                 # Calculate realized P&L
@@ -175,7 +339,7 @@ class PaperTrader:
         quantity = trade["quantity"]
         action = trade["action"]
 
-        if action == "BUY":
+        if action == BUY:
             # For demo, assume immediate small gain/loss based on slippage
             return (signal_price - execution_price) * quantity
         else:
@@ -184,18 +348,19 @@ class PaperTrader:
 
     async def close_daily_session(self) -> Dict[str, Any]:
         """Close daily paper trading session and generate summary"""
+        self._format_trade_timestamps()
         summary = {
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "date": self._session_date,
             "initial_capital": self.initial_capital,
             "available_capital": self.available_capital,
             "capital_utilized": self.initial_capital - self.available_capital,
             "daily_pnl": self.daily_pnl,
             "total_trades": len(self.trades),
-            "buy_trades": len([t for t in self.trades if t["action"] == "BUY"]),
-            "sell_trades": len([t for t in self.trades if t["action"] == "SELL"]),
-            "total_commission": sum(t["commission"] for t in self.trades),
-            "portfolio": self.portfolio.copy(),
-            "trades": self.trades.copy(),
+            "buy_trades": self.trade_columns.count(BUY),
+            "sell_trades": self.trade_columns.count(SELL),
+            "total_commission": self.trade_columns.total("commission"),
+            "portfolio": self._copy_positions(),
+            "trades": tuple(self.trades),
         }
 
         # Calculate portfolio value
@@ -210,20 +375,32 @@ class PaperTrader:
 
         logger.info(
             f"Paper trading session closed: {summary['total_trades']} trades, "
-            f"P&L: ₹{self.daily_pnl:,.2f}, Return: {summary['return_pct']:.2f}%"
+            f"P&L: ₹{summary['daily_pnl']:,.2f}, Return: {summary['return_pct']:.2f}%"
         )
 
         return summary
 
     def get_portfolio_summary(self) -> Dict[str, Any]:
-        """Get current portfolio summary"""
+        """Get current portfolio summary (positions are copies)"""
         return {
-            "positions": self.portfolio.copy(),
+            "positions": self._copy_positions(),
             "available_capital": self.available_capital,
             "daily_pnl": self.daily_pnl,
             "total_trades": len(self.trades),
         }
 
-    def get_trade_history(self) -> List[Dict[str, Any]]:
-        """Get trade history"""
-        return self.trades.copy()
+    def get_trade_history(self) -> Tuple[Dict[str, Any], ...]:
+        """Get trade history as an immutable snapshot of the trade list"""
+        self._format_trade_timestamps()
+        return tuple(self.trades)
+
+    def _copy_positions(self) -> Dict[str, Dict[str, Any]]:
+        """Positions copied one level deep, so callers cannot edit live state"""
+        return {symbol: dict(pos) for symbol, pos in self.portfolio.items()}
+
+    def _format_trade_timestamps(self):
+        """Add ISO timestamps to trades recorded since the last export"""
+        for trade in self.trades[self._formatted_trades :]:
+            if "timestamp" not in trade:
+                trade["timestamp"] = _iso_timestamp(trade["timestamp_ns"])
+        self._formatted_trades = len(self.trades)
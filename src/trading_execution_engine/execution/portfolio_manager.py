@@ -11,10 +11,11 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, Optional, TypeVar, cast
 
 import numpy as np
 import pandas as pd
@@ -26,8 +27,51 @@ from trading_execution_engine.strategies.enhanced_strategies import (
 )
 from trading_execution_engine.utils.data_cleaner import clean_ohlcv_data
 
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
 logger = logging.getLogger(__name__)
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _jit(func: _F) -> _F:
+    """Compile with numba.njit when numba is installed, else use func as-is."""
+    if NUMBA_AVAILABLE:
+        return cast(_F, numba.njit(cache=True)(func))
+    return func
+
+
+@_jit
+def _volatility_target_shares(
+    portfolio_value: float,
+    entry_price: float,
+    volatility: float,
+    confidence: float,
+    target_vol: float,
+    max_position_size: float,
+) -> float:
+    """Shares for a volatility-targeted position, capped at the max position size"""
+    max_shares = portfolio_value * max_position_size / entry_price
+    if volatility > 0:
+        position_value = (portfolio_value * target_vol * confidence) / volatility
+        return min(position_value / entry_price, max_shares)
+    return max_shares
+
+
+@_jit
+def _weighted_returns_std(weights: np.ndarray, returns: np.ndarray) -> float:
+    """Std of the weighted sum of per-position return rows (positions x periods)"""
+    combined = np.zeros(returns.shape[1])
+    for k in range(returns.shape[0]):
+        combined += returns[k] * weights[k]
+    return combined.std()
+
 
 class PositionSizeMethod(Enum):
     EQUAL_WEIGHT = "equal_weight"
@@ -36,7 +80,7 @@ class PositionSizeMethod(Enum):
     VOLATILITY_TARGET = "volatility_target"
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     ticker: str
     shares: float
@@ -59,7 +103,7 @@ class Position:
         return (self.current_price - self.entry_price) / self.entry_price
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     ticker: str
     action: str  # BUY/SELL
@@ -69,6 +113,7 @@ class Trade:
     strategy: str
     reason: str
     commission: float = 0.0
+    realized_pnl: float = 0.0  # Set on SELL trades against the average entry
 
 
 class RiskManager:
@@ -113,19 +158,14 @@ class RiskManager:
 
         elif method == PositionSizeMethod.VOLATILITY_TARGET:
             # Target volatility approach with confidence scaling
-            target_vol = 0.02  # 2% target volatility
-            confidence_multiplier = confidence  # Scale by signal confidence
-
-            if volatility > 0:
-                position_value = (
-                    portfolio_value * target_vol * confidence_multiplier
-                ) / volatility
-                return min(
-                    position_value / entry_price,
-                    portfolio_value * self.max_position_size / entry_price,
-                )
-            else:
-                return portfolio_value * self.max_position_size / entry_price
+            return _volatility_target_shares(
+                float(portfolio_value),
+                float(entry_price),
+                float(volatility),
+                float(confidence),  # Scale by signal confidence
+                0.02,  # 2% target volatility
+                self.max_position_size,
+            )
 
         elif method == PositionSizeMethod.KELLY_CRITERION:
             # Simplified Kelly criterion (requires win rate and avg win/loss)
@@ -171,6 +211,10 @@ class Portfolio:
         self.risk_manager = RiskManager()
         self.position_size_method = position_size_method
 
+        # Running sum of position market values, updated by deltas on every
+        # price mark and trade so portfolio_value is O(1)
+        self._positions_value = 0.0
+
         # Performance tracking
         self.daily_values = []
         self.daily_returns = []
@@ -179,8 +223,7 @@ class Portfolio:
     @property
     def portfolio_value(self) -> float:
         """Current total portfolio value"""
-        positions_value = sum(pos.market_value for pos in self.positions.values())
-        return self.cash + positions_value
+        return self.cash + self._positions_value
 
     @property
     def total_return(self) -> float:
@@ -190,8 +233,14 @@ class Portfolio:
     def update_position_prices(self, price_data: dict[str, float]):
         """Update current prices for all positions"""
         for ticker, position in self.positions.items():
-            if ticker in price_data:
-                position.current_price = price_data[ticker]
+            price = price_data.get(ticker)
+            if price is not None:
+                self._mark_position(position, price)
+
+    def _mark_position(self, position: Position, price: float) -> None:
+        """Mark a position to a new price, keeping the positions value in sync"""
+        self._positions_value += position.shares * (price - position.current_price)
+        position.current_price = price
 
     def calculate_portfolio_volatility(
         self, price_data: dict[str, np.ndarray], window: int = 30
@@ -200,19 +249,21 @@ class Portfolio:
         if not self.positions:
             return 0.0
 
-        portfolio_returns = []
+        # Preallocated (positions x periods) return rows, filled in place
+        returns = np.empty((len(self.positions), window - 1))
+        weights = np.empty(len(self.positions))
+        portfolio_value = self.portfolio_value
+        rows = 0
         for ticker, position in self.positions.items():
-            if ticker in price_data and len(price_data[ticker]) > window:
-                returns = (
-                    np.diff(price_data[ticker][-window:])
-                    / price_data[ticker][-window:-1]
-                )
-                weight = position.market_value / self.portfolio_value
-                portfolio_returns.append(returns * weight)
+            prices = price_data.get(ticker)
+            if prices is not None and len(prices) > window:
+                recent = prices[-window:]
+                np.divide(np.diff(recent), recent[:-1], out=returns[rows])
+                weights[rows] = position.market_value / portfolio_value
+                rows += 1
 
-        if portfolio_returns:
-            total_returns = np.sum(portfolio_returns, axis=0)
-            return np.std(total_returns)
+        if rows:
+            return float(_weighted_returns_std(weights[:rows], returns[:rows]))
 
         return 0.0
 
@@ -253,6 +304,7 @@ class Portfolio:
                 if ticker in self.positions:
                     # Average down/up
                     old_position = self.positions[ticker]
+                    self._positions_value -= old_position.market_value
                     total_shares = old_position.shares + position_size
                     avg_price = (
                         (old_position.shares * old_position.entry_price)
@@ -269,6 +321,7 @@ class Portfolio:
                         confidence=max(old_position.confidence, confidence),
                     )
                 else:
+                    ticker = sys.intern(ticker)
                     self.positions[ticker] = Position(
                         ticker=ticker,
                         shares=position_size,
@@ -279,6 +332,8 @@ class Portfolio:
                         confidence=confidence,
                     )
 
+                self._positions_value += self.positions[ticker].market_value
+
                 self.trades.append(
                     Trade(
                         ticker=ticker,
@@ -315,10 +370,15 @@ class Portfolio:
                         strategy=strategy,
                         reason=reason,
                         commission=commission,
+                        realized_pnl=(price - position.entry_price) * position.shares,
                     )
                 )
 
                 del self.positions[ticker]
+                if self.positions:
+                    self._positions_value -= position.market_value
+                else:
+                    self._positions_value = 0.0  # Drop accumulated rounding drift
                 return True
 
         return False
@@ -330,22 +390,23 @@ class Portfolio:
         positions_to_close = []
 
         for ticker, position in self.positions.items():
-            if ticker in current_prices:
-                position.current_price = current_prices[ticker]
+            price = current_prices.get(ticker)
+            if price is not None:
+                self._mark_position(position, price)
 
                 if self.risk_manager.should_stop_loss(position):
-                    positions_to_close.append((ticker, "Stop Loss"))
+                    positions_to_close.append((ticker, "Stop Loss", position))
                 elif self.risk_manager.should_take_profit(position):
-                    positions_to_close.append((ticker, "Take Profit"))
+                    positions_to_close.append((ticker, "Take Profit", position))
 
-        for ticker, reason in positions_to_close:
+        for ticker, reason, position in positions_to_close:
             self.execute_trade(
                 ticker=ticker,
                 action="SELL",
-                price=current_prices[ticker],
+                price=position.current_price,
                 timestamp=timestamp,
-                strategy=self.positions[ticker].strategy,
-                confidence=self.positions[ticker].confidence,
+                strategy=position.strategy,
+                confidence=position.confidence,
                 reason=reason,
             )
 
@@ -355,36 +416,33 @@ class Portfolio:
             return {}
 
         returns = np.array(self.daily_returns)
+        mean_return = returns.mean()
+        std_return = returns.std()
 
         # Basic metrics
         total_return = self.total_return
-        volatility = np.std(returns) * np.sqrt(252) * 100  # Annualized
+        volatility = std_return * np.sqrt(252) * 100  # Annualized
 
         # Sharpe ratio
         sharpe = (
-            (np.mean(returns) * 252) / (np.std(returns) * np.sqrt(252))
-            if np.std(returns) > 0
-            else 0
+            (mean_return * 252) / (std_return * np.sqrt(252)) if std_return > 0 else 0
         )
 
-        # Maximum drawdown
-        cumulative = np.cumprod(1 + returns / 100)
+        # Maximum drawdown, computed in place on the cumulative growth buffer
+        cumulative = returns / 100
+        cumulative += 1
+        np.cumprod(cumulative, out=cumulative)
         running_max = np.maximum.accumulate(cumulative)
-        drawdowns = (cumulative - running_max) / running_max * 100
-        max_drawdown = np.min(drawdowns)
-
-        # Win rate
-        winning_trades = sum(
-            1
-            for trade in self.trades
-            if trade.action == "SELL"
-            and any(
-                p.ticker == trade.ticker
-                for p in self.positions.values()
-                if (trade.price - p.entry_price) > 0
-            )
-        )
-        total_trades = sum(1 for trade in self.trades if trade.action == "SELL")
+        max_drawdown = ((cumulative - running_max) / running_max).min() * 100
+
+        # Win rate over closed (SELL) trades
+        winning_trades = 0
+        total_trades = 0
+        for trade in self.trades:
+            if trade.action == "SELL":
+                total_trades += 1
+                if trade.realized_pnl > 0:
+                    winning_trades += 1
         win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
 
         return {
@@ -399,6 +457,75 @@ class Portfolio:
         }
 
 
+def _strategy_signal_matrices(
+    strategy_name: str,
+    strategy_func: Callable[..., Any],
+    data: dict[str, pd.DataFrame],
+    all_dates: pd.Index,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Run a strategy once per ticker over its full history.
+
+    Returns (days x tickers) signal and confidence matrices aligned on
+    ``all_dates``. Strategies must be causal: bar i of their output has to
+    equal what they would emit on data up to bar i. ``signals`` must hold one
+    value per bar; ``confidence`` may hold one value per bar as well. A scalar
+    confidence summarizes the whole history it was given, so it cannot be
+    spread across bars; those cells are left NaN and resolved per day by
+    _confidence_as_of. A ticker whose output has the wrong length, or whose
+    strategy call fails, contributes no signals.
+    """
+    signal_matrix = np.zeros((len(all_dates), len(data)))
+    confidence_matrix = np.full((len(all_dates), len(data)), np.nan)
+    for j, (ticker, df) in enumerate(data.items()):
+        try:
+            signals, confidence = strategy_func(df)
+            signals = np.asarray(signals, dtype=float)
+            per_bar_confidence = np.ndim(confidence) > 0
+            if per_bar_confidence:
+                confidence = np.asarray(confidence, dtype=float)
+        except Exception as e:
+            logger.debug(
+                "Error generating %s signals for %s: %s", strategy_name, ticker, e
+            )
+            continue
+
+        if signals.shape != (len(df),) or (
+            per_bar_confidence and confidence.shape != (len(df),)
+        ):
+            logger.warning(
+                "%s returned output of the wrong length for %s (%d bars); "
+                "skipping its signals",
+                strategy_name,
+                ticker,
+                len(df),
+            )
+            continue
+
+        rows = all_dates.get_indexer(df.index)
+        signal_matrix[rows, j] = signals
+        if per_bar_confidence:
+            confidence_matrix[rows, j] = confidence
+    return signal_matrix, confidence_matrix
+
+
+def _confidence_as_of(
+    strategy_name: str,
+    strategy_func: Callable[..., Any],
+    df: pd.DataFrame,
+    bars: int,
+) -> Optional[float]:
+    """Strategy confidence computed on the first ``bars`` bars only"""
+    try:
+        _, confidence = strategy_func(df.iloc[:bars])
+    except Exception as e:
+        logger.debug("Error generating %s confidence: %s", strategy_name, e)
+        return None
+    if np.ndim(confidence) > 0:
+        confidence = np.asarray(confidence, dtype=float)[-1]
+    return float(confidence)
+
+
 def run_portfolio_backtest(
     tickers: list[str],
     strategies: dict[str, callable],
@@ -411,11 +538,21 @@ def run_portfolio_backtest(
     logger.info("Running portfolio backtest with {len(tickers)} assets")
     logger.info("Strategies: {list(strategies.keys())}")
 
-    # Load data for all tickers
+    # Load data for all tickers; downloads are I/O bound, so fetch them
+    # concurrently and clean the results in order on this thread. Tickers are
+    # interned so the per-day position/price dict lookups match by identity.
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(tickers)))) as executor:
+        downloads = {
+            sys.intern(ticker): executor.submit(
+                load_yfinance_data, ticker, start_date, end_date
+            )
+            for ticker in tickers
+        }
+
     data = {}
-    for ticker in tickers:
+    for ticker, download in downloads.items():
         try:
-            raw_df = load_yfinance_data(ticker, start_date, end_date)
+            raw_df = download.result()
             clean_df = clean_ohlcv_data(raw_df)
             clean_df.ffill(inplace=True)
             clean_df.bfill(inplace=True)
@@ -435,72 +572,110 @@ def run_portfolio_backtest(
     portfolio = Portfolio(initial_capital=initial_capital)
 
     # Get all unique dates
-    all_dates = set()
-    for df in data.values():
-        all_dates.update(df.index)
-
-    all_dates = sorted(list(all_dates))
+    frames = iter(data.values())
+    all_dates = next(frames).index
+    for df in frames:
+        all_dates = all_dates.union(df.index)
+    all_dates = all_dates.sort_values()
     logger.info("Backtesting over {len(all_dates)} trading days")
 
+    # Align every ticker on the shared calendar once so the daily loop reads
+    # precomputed arrays by position instead of reslicing DataFrames per day
+    tickers = list(data)
+    ticker_frames = list(data.values())
+    closes = (
+        pd.concat({ticker: df["close"] for ticker, df in data.items()}, axis=1)
+        .reindex(all_dates)
+        .to_numpy(dtype=float)
+    )
+    has_bar = ~np.isnan(closes)
+    bar_counts = has_bar.cumsum(axis=0)  # Bars seen per ticker up to each day
+
+    # 20-day rolling volatility on each ticker's own bars, 2% until warmed up
+    volatilities = (
+        pd.concat(
+            {
+                ticker: df["close"].pct_change().rolling(20).std()
+                for ticker, df in data.items()
+            },
+            axis=1,
+        )
+        .reindex(all_dates)
+        .fillna(0.02)
+        .to_numpy()
+    )
+
+    # Signal/confidence matrices per strategy, computed once per ticker
+    strategy_signals = {}
+    signal_cache = {}  # Strategy function -> matrices, shared by aliases
+    for strategy_name, strategy_func in strategies.items():
+        if strategy_func not in signal_cache:
+            signal_cache[strategy_func] = _strategy_signal_matrices(
+                strategy_name, strategy_func, data, all_dates
+            )
+        strategy_signals[strategy_name] = (strategy_func, *signal_cache[strategy_func])
+
     # Run backtest day by day
-    for date in all_dates:
+    for i, date in enumerate(all_dates):
         current_prices = {}
 
-        # Get current prices and generate signals
-        for ticker, df in data.items():
-            if date in df.index:
-                current_price = df.loc[date, "close"]
-                current_prices[ticker] = current_price
-
-                # Get data up to current date for signal generation
-                historical_data = df.loc[df.index <= date]
-
-                if len(historical_data) >= 30:  # Minimum for signal generation
-                    # Generate signals for each strategy
-                    for strategy_name, strategy_func in strategies.items():
-                        try:
-                            signals, confidence = strategy_func(historical_data)
-                            current_signal = signals[-1] if signals else 0
-
-                            # Calculate volatility
-                            if len(historical_data) >= 20:
-                                returns = historical_data["close"].pct_change().dropna()
-                                volatility = returns.rolling(20).std().iloc[-1]
-                                if pd.isna(volatility):
-                                    volatility = 0.02
-                            else:
-                                volatility = 0.02
-
-                            # Execute trades based on signals
-                            if current_signal > 0 and ticker not in portfolio.positions:
-                                # Buy signal
-                                portfolio.execute_trade(
-                                    ticker=ticker,
-                                    action="BUY",
-                                    price=current_price,
-                                    timestamp=date,
-                                    strategy=strategy_name,
-                                    confidence=confidence,
-                                    reason="{strategy_name} buy signal",
-                                    volatility=volatility,
-                                )
-
-                            elif current_signal < 0 and ticker in portfolio.positions:
-                                # Sell signal
-                                portfolio.execute_trade(
-                                    ticker=ticker,
-                                    action="SELL",
-                                    price=current_price,
-                                    timestamp=date,
-                                    strategy=strategy_name,
-                                    confidence=confidence,
-                                    reason="{strategy_name} sell signal",
-                                )
-
-                        except Exception as e:
-                            logger.debug(
-                                "Error generating {strategy_name} signal for {ticker}: {e}"
-                            )
+        for j, ticker in enumerate(tickers):
+            if not has_bar[i, j]:
+                continue
+
+            current_price = closes[i, j]
+            current_prices[ticker] = current_price
+
+            if bar_counts[i, j] < 30:  # Minimum for signal generation
+                continue
+
+            volatility = volatilities[i, j]
+
+            for strategy_name, (
+                strategy_func,
+                signal_matrix,
+                confidence_matrix,
+            ) in strategy_signals.items():
+                current_signal = signal_matrix[i, j]
+                if current_signal > 0 and ticker not in portfolio.positions:
+                    action = "BUY"
+                elif current_signal < 0 and ticker in portfolio.positions:
+                    action = "SELL"
+                else:
+                    continue
+
+                confidence = confidence_matrix[i, j]
+                if np.isnan(confidence):
+                    # Scalar confidence: recompute on the bars seen so far so
+                    # sizing never uses later data
+                    confidence = _confidence_as_of(
+                        strategy_name, strategy_func, ticker_frames[j], bar_counts[i, j]
+                    )
+                    if confidence is None:
+                        continue
+
+                # Execute trades based on signals
+                if action == "BUY":
+                    portfolio.execute_trade(
+                        ticker=ticker,
+                        action="BUY",
+                        price=current_price,
+                        timestamp=date,
+                        strategy=strategy_name,
+                        confidence=confidence,
+                        reason=f"{strategy_name} buy signal",
+                        volatility=volatility,
+                    )
+                else:
+                    portfolio.execute_trade(
+                        ticker=ticker,
+                        action="SELL",
+                        price=current_price,
+                        timestamp=date,
+                        strategy=strategy_name,
+                        confidence=confidence,
+                        reason=f"{strategy_name} sell signal",
+                    )
 
         # Update portfolio with current prices
         portfolio.update_position_prices(current_prices)
@@ -7,17 +7,39 @@ for trading execution, risk management, and compliance.
 
 import asyncio
 import logging
+import logging.handlers
 import os
-import signal
 import sys
-from typing import Optional
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict
+
+from trading_execution_engine.utils.logger import (
+    _file_queue,
+    configure_package_logging,
+    stop_listeners,
+)
+
+try:
+    import uvloop  # noqa: F401
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import httptools  # noqa: F401
+
+    HTTPTOOLS_AVAILABLE = True
+except ImportError:
+    HTTPTOOLS_AVAILABLE = False
+
 
 # Setup basic logging
-log_handlers = [logging.StreamHandler(sys.stdout)]
+log_handlers: list[logging.Handler] = [logging.StreamHandler(sys.stdout)]
 
 # Only add file handler if running in container or logs directory exists
 log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../logs")
@@ -28,7 +50,12 @@ if os.path.exists("/app/logs") or os.path.exists(log_dir):
         else os.path.join(log_dir, "trading_execution.log")
     )
     os.makedirs(os.path.dirname(log_path), exist_ok=True)
-    log_handlers.append(logging.FileHandler(log_path, mode="a"))
+
+    # File writes happen on the shared buffered listener, off the request path.
+    # The listener's file handler adds the timestamp and level itself
+    file_queue_handler = logging.handlers.QueueHandler(_file_queue(log_path))
+    file_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    log_handlers.append(file_queue_handler)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -38,6 +65,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Import path uvicorn worker processes load the app from
+APP_MODULE = "trading_execution_engine.main:app"
+
 # Create FastAPI app
 app = FastAPI(
     title="Trading Execution Engine",
@@ -55,64 +85,105 @@ app.add_middleware(
 )
 
 
-@app.get("/")
+class RootResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    message: str
+    status: str
+    version: str
+    paper_trading: bool
+    sebi_compliance: bool
+
+
+class ServiceStates(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    execution_engine: str
+    risk_management: str
+    order_management: str
+    compliance: str
+
+
+class HealthResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    status: str
+    services: ServiceStates
+    paper_trading_mode: bool
+
+
+class ConnectionStates(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    broker_api: str
+    market_data: str
+    risk_service: str
+
+
+class StatusResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    system: str
+    mode: str
+    compliance: str
+    risk_management: str
+    connections: ConnectionStates
+
+
+# Responses are constant, so they are encoded once at import and served as-is
+_ROOT_BODY = RootResponse(
+    message="Trading Execution Engine is running",
+    status="healthy",
+    version="0.1.0",
+    paper_trading=True,
+    sebi_compliance=True,
+).model_dump_json()
+
+_HEALTH_BODY = HealthResponse(
+    status="healthy",
+    services=ServiceStates(
+        execution_engine="running",
+        risk_management="active",
+        order_management="ready",
+        compliance="enabled",
+    ),
+    paper_trading_mode=True,
+).model_dump_json()
+
+_STATUS_BODY = StatusResponse(
+    system="Trading Execution Engine",
+    mode="PAPER_TRADING",
+    compliance="SEBI_ENABLED",
+    risk_management="ACTIVE",
+    connections=ConnectionStates(
+        broker_api="ready",
+        market_data="ready",
+        risk_service="ready",
+    ),
+).model_dump_json()
+
+
+@app.get("/", response_class=Response, responses={200: {"model": RootResponse}})
 async def root():
     """Root endpoint for health checks."""
-    return {
-        "message": "Trading Execution Engine is running",
-        "status": "healthy",
-        "version": "0.1.0",
-        "paper_trading": True,
-        "sebi_compliance": True,
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
-@app.get("/health")
+@app.get("/health", response_class=Response, responses={200: {"model": HealthResponse}})
 async def health_check():
     """Detailed health check endpoint."""
-    return {
-        "status": "healthy",
-        "services": {
-            "execution_engine": "running",
-            "risk_management": "active",
-            "order_management": "ready",
-            "compliance": "enabled",
-        },
-        "paper_trading_mode": True,
-    }
-
-
-@app.get("/status")
-async def get_status():
-    """Get system status."""
-    return {
-        "system": "Trading Execution Engine",
-        "mode": "PAPER_TRADING",
-        "compliance": "SEBI_ENABLED",
-        "risk_management": "ACTIVE",
-        "connections": {
-            "broker_api": "ready",
-            "market_data": "ready",
-            "risk_service": "ready",
-        },
-    }
-
+    return Response(_HEALTH_BODY, media_type="application/json")
 
-class GracefulShutdown:
-    """Handle graceful shutdown of the application."""
 
-    def __init__(self):
-        self.shutdown = False
-        signal.signal(signal.SIGINT, self._exit_gracefully)
-        signal.signal(signal.SIGTERM, self._exit_gracefully)
-
-    def _exit_gracefully(self, signum, frame):
-        logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-        self.shutdown = True
+@app.get("/status", response_class=Response, responses={200: {"model": StatusResponse}})
+async def get_status():
+    """Get system status."""
+    return Response(_STATUS_BODY, media_type="application/json")
 
 
 async def startup_event():
     """Application startup event."""
+    configure_package_logging()
     logger.info("Trading Execution Engine starting up...")
     logger.info("Running in PAPER TRADING mode - SEBI compliant")
     logger.info("All systems initialized successfully")
@@ -129,27 +200,55 @@ app.add_event_handler("startup", startup_event)
 app.add_event_handler("shutdown", shutdown_event)
 
 
+def usable_cpu_count() -> int:
+    """CPUs this process is allowed to run on, not every CPU on the host."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
 def main():
     """Main function to run the application."""
     try:
+        configure_package_logging()
         logger.info("Starting Trading Execution Engine...")
 
-        # Initialize graceful shutdown handler
-        shutdown_handler = GracefulShutdown()
-
         # Get port from environment variable (Cloud Run sets PORT)
         port = int(os.environ.get("PORT", 8080))
-        logger.info(f"Starting server on port {port}")
+        # One worker per core this process may run on; WEB_CONCURRENCY overrides
+        workers = int(os.environ.get("WEB_CONCURRENCY", 0)) or usable_cpu_count()
+        logger.info("Starting server on port %d with %d worker(s)", port, workers)
+
+        # uvloop + httptools when installed; UVICORN_LOOP/UVICORN_HTTP override
+        loop = os.environ.get("UVICORN_LOOP", "uvloop" if UVLOOP_AVAILABLE else "auto")
+        http = os.environ.get(
+            "UVICORN_HTTP", "httptools" if HTTPTOOLS_AVAILABLE else "auto"
+        )
+        # Server and access logging stay on by default; set
+        # UVICORN_LOG_LEVEL / UVICORN_ACCESS_LOG=0 to quiet them
+        log_level = os.environ.get("UVICORN_LOG_LEVEL", "info")
+        access_log = os.environ.get("UVICORN_ACCESS_LOG", "1") != "0"
+
+        # Worker processes import the app themselves, so it must be passed by
+        # import path; uvicorn handles SIGINT/SIGTERM and runs the shutdown
+        # event in every worker
+        target = app if workers == 1 else os.environ.get("APP_MODULE", APP_MODULE)
 
         # Run the server
         uvicorn.run(
-            app,
+            target,
             host="0.0.0.0",  # nosec B104 - Required for container deployment
             port=port,
-            log_level="info",
-            access_log=True,
+            log_level=log_level,
+            access_log=access_log,
+            loop=loop,
+            http=http,
+            workers=workers,
         )
 
+        # Drain and close the log file once the server has exited
+        stop_listeners()
+
     except Exception as e:
         logger.error(f"Failed to start Trading Execution Engine: {e}")
         sys.exit(1)
@@ -8,39 +8,171 @@ Author: SJ Trading
 Licensed by SJ Trading
 """
 
-import json
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-
+import asyncio
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from datetime import date, datetime
+from itertools import count
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from ..utils.columns import grow_columns
+from ..utils.json_utils import dumps
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds between writes of evicted tracking entries to the spill file
+SPILL_INTERVAL = 30.0
+
+# Shared read-only default for absent result dicts (never mutated)
+_NO_RESULT: Dict[str, Any] = {}
+
+
+class SignalColumns:
+    """
+    Columnar (structure-of-arrays) buffer of tracked signals
+
+    Strategy and symbol are dictionary-encoded so per-group counts and P&L
+    are ``np.bincount`` reductions rather than Python passes over dicts.
+    """
+
+    __slots__ = ("size", "strategy_idx", "symbol_idx", "pnl", "strategies", "symbols")
+
+    def __init__(self, capacity: int = 1024):
+        self.size = 0
+        self.strategy_idx = np.empty(capacity, dtype=np.int32)
+        self.symbol_idx = np.empty(capacity, dtype=np.int32)
+        self.pnl = np.empty(capacity, dtype=np.float64)
+        # Value -> code tables; unseen values get the next code on lookup
+        self.strategies: Dict[Any, int] = defaultdict(count().__next__)
+        self.symbols: Dict[Any, int] = defaultdict(count().__next__)
+
+    def append(self, strategy: Any, symbol: Any, pnl: float):
+        """Append one signal, doubling the buffers when full"""
+        if self.size == len(self.pnl):
+            self._grow()
+
+        i = self.size
+        self.strategy_idx[i] = self.strategies[strategy]
+        self.symbol_idx[i] = self.symbols[symbol]
+        self.pnl[i] = pnl
+        self.size = i + 1
+
+    def _grow(self):
+        grow_columns(self, ("strategy_idx", "symbol_idx", "pnl"), self.size)
+
+    def strategy_performance(self) -> Dict[Any, Dict[str, Any]]:
+        """Signal count and P&L per strategy"""
+        return self._performance(self.strategy_idx, self.strategies)
+
+    def symbol_performance(self) -> Dict[Any, Dict[str, Any]]:
+        """Signal count and P&L per symbol"""
+        return self._performance(self.symbol_idx, self.symbols)
+
+    def _performance(
+        self, codes: np.ndarray, names: Dict[Any, int]
+    ) -> Dict[Any, Dict[str, Any]]:
+        codes = codes[: self.size]
+        counts = np.bincount(codes, minlength=len(names))
+        pnl = np.bincount(codes, weights=self.pnl[: self.size], minlength=len(names))
+        return {
+            name: {"count": int(counts[code]), "pnl": float(pnl[code])}
+            for name, code in names.items()
+        }
+
+
+class ExecutionColumns:
+    """
+    Buffer of tracked execution costs, one float64 row per execution
+
+    Rows are contiguous, so all column totals come out of a single
+    ``sum(axis=0)`` pass over the buffer.
+    """
+
+    FIELDS = ("slippage", "commission", "execution_time_ms", "pnl")
+
+    __slots__ = ("size", "values")
+
+    def __init__(self, capacity: int = 1024):
+        self.size = 0
+        self.values = np.empty((capacity, len(self.FIELDS)), dtype=np.float64)
+
+    def append(
+        self, slippage: float, commission: float, execution_time_ms: float, pnl: float
+    ):
+        """Append one execution, doubling the buffer when full"""
+        if self.size == len(self.values):
+            grow_columns(self, ("values",), self.size)
+
+        self.values[self.size] = (slippage, commission, execution_time_ms, pnl)
+        self.size += 1
+
+    def totals(self) -> Dict[str, float]:
+        """Sum of every field over the recorded executions, in one pass"""
+        sums = self.values[: self.size].sum(axis=0)
+        return dict(zip(self.FIELDS, sums.tolist()))
+
 
 class ExecutionPerformanceTracker:
     """
     Tracks and analyzes execution performance
     """
 
+    # Monotonic high-resolution clock used for execution latency
+    _clock = staticmethod(time.perf_counter_ns)
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.daily_metrics = {}
-        self.signal_tracking = []
-        self.execution_tracking = []
+        self._today_str = date.today().isoformat()
+
+        # Detailed entries are kept in bounded ring buffers; entries that fall
+        # off are appended to ``tracking_spill_path`` (JSON lines) when set
+        self._max_tracked = config.get("max_tracked", 50_000)
+        self._spill_path = config.get("tracking_spill_path")
+        self._spilled: List[bytes] = []
+        self._last_spill = time.monotonic()
+        self.signal_tracking: Deque[Dict[str, Any]] = deque(maxlen=self._max_tracked)
+        self.execution_tracking: Deque[Dict[str, Any]] = deque(maxlen=self._max_tracked)
+        self.signal_columns = SignalColumns()
+        self.execution_columns = ExecutionColumns()
+        self._successful_trades = 0
+
+        # Tracking events queued by track_* and applied by the drain task
+        self._inbox: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
 
         # Alert thresholds
         self.alert_thresholds = config.get(
             "alert_thresholds",
             {"daily_loss_pct": 2, "drawdown_pct": 5, "low_success_rate": 0.4},
         )
+        self._capital = config.get("initial_capital", 1000000)  # Defaults to 10L
+        self._set_alert_limits()
 
         logger.info("Execution performance tracker initialized")
 
+    def _set_alert_limits(self):
+        """Precompute alert thresholds in the units _check_alerts compares"""
+        self._loss_threshold_abs = -(
+            self.alert_thresholds["daily_loss_pct"] / 100.0 * self._capital
+        )
+        self._low_success_rate = self.alert_thresholds["low_success_rate"]
+
     async def start_daily_session(self):
         """Start a new daily tracking session"""
+        if self._drain_task is not None:
+            await self.flush()
+            self._drain_task.cancel()
+
+        now = datetime.now()
+        self._today_str = now.date().isoformat()
         self.daily_metrics = {
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "session_start": datetime.now().isoformat(),
+            "date": self._today_str,
+            "session_start": now.isoformat(),
             "signals_received": 0,
             "signals_executed_paper": 0,
             "signals_executed_manual": 0,
@@ -49,19 +181,84 @@ class ExecutionPerformanceTracker:
             "max_drawdown": 0.0,
             "alerts_triggered": [],
         }
+        self._set_alert_limits()
 
-        self.signal_tracking = []
-        self.execution_tracking = []
+        self._write_spill()
+        self.signal_tracking = deque(maxlen=self._max_tracked)
+        self.execution_tracking = deque(maxlen=self._max_tracked)
+        self.signal_columns = SignalColumns()
+        self.execution_columns = ExecutionColumns()
+        self._successful_trades = 0
+
+        self._inbox = asyncio.Queue()
+        self._drain_task = asyncio.create_task(self._drain())
 
         logger.info("Daily performance tracking session started")
 
-    async def track_signal(
-        self, signal: Dict[str, Any], execution_results: Dict[str, Any]
+    def track_signal(self, signal: Dict[str, Any], execution_results: Dict[str, Any]):
+        """
+        Track a signal and its execution results
+
+        Only queues the event for the session's drain task; call ``flush`` to
+        wait until everything queued so far has been applied.
+        """
+        self._submit(self._apply_signal, signal, execution_results)
+
+    def track_execution(self, execution_data: Dict[str, Any]):
+        """
+        Track execution details (queued like ``track_signal``)
+
+        Record ``execution_time_ms`` by wrapping the order placement in
+        ``time_execution(execution_data)``.
+        """
+        self._submit(self._apply_execution, execution_data)
+
+    @contextmanager
+    def time_execution(self, execution_data: Dict[str, Any]) -> Iterator[None]:
+        """Time the enclosed block into ``execution_data["execution_time_ms"]``"""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            execution_data["execution_time_ms"] = (self._clock() - start) / 1e6
+
+    async def flush(self):
+        """Wait until all queued tracking events have been applied"""
+        if self._inbox is not None:
+            await self._inbox.join()
+
+    def _submit(self, apply: Callable[..., None], *args: Any):
+        timestamp_ns = time.time_ns()
+        if self._inbox is None:
+            # No session drain task yet; apply inline
+            apply(*args, timestamp_ns)
+        else:
+            self._inbox.put_nowait((apply, args, timestamp_ns))
+
+    async def _drain(self):
+        """Apply queued tracking events in arrival order"""
+        inbox = self._inbox
+        while True:
+            apply, args, timestamp_ns = await inbox.get()
+            try:
+                apply(*args, timestamp_ns)
+            except Exception:
+                logger.exception("Failed to apply tracking event")
+            finally:
+                inbox.task_done()
+
+    def _apply_signal(
+        self,
+        signal: Dict[str, Any],
+        execution_results: Dict[str, Any],
+        timestamp_ns: int,
     ):
-        """Track a signal and its execution results"""
+        now_iso = datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
         tracking_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "signal_id": signal.get("signal_id", f"signal_{len(self.signal_tracking)}"),
+            "timestamp": now_iso,
+            "signal_id": signal.get(
+                "signal_id", f"signal_{self.daily_metrics['signals_received']}"
+            ),
             "symbol": signal.get("symbol"),
             "action": signal.get("action"),
             "strategy": signal.get("strategy"),
@@ -72,33 +269,37 @@ class ExecutionPerformanceTracker:
             "signal_data": signal,
         }
 
-        self.signal_tracking.append(tracking_entry)
+        self._append_tracked(self.signal_tracking, tracking_entry)
         self.daily_metrics["signals_received"] += 1
 
         # Track execution counts
-        if execution_results.get("paper_result", {}).get("executed"):
+        paper_result = execution_results.get("paper_result", _NO_RESULT)
+        if paper_result.get("executed"):
             self.daily_metrics["signals_executed_paper"] += 1
 
-        if execution_results.get("manual_result", {}).get("user_executed"):
+        if execution_results.get("manual_result", _NO_RESULT).get("user_executed"):
             self.daily_metrics["signals_executed_manual"] += 1
 
         # Update P&L if available
-        paper_pnl = execution_results.get("paper_result", {}).get("pnl", 0)
+        paper_pnl = paper_result.get("pnl", 0)
         self.daily_metrics["total_pnl"] += paper_pnl
+        self._successful_trades += paper_pnl > 0
+        self.signal_columns.append(
+            tracking_entry["strategy"], tracking_entry["symbol"], paper_pnl
+        )
 
         # Check for alerts
-        await self._check_alerts()
+        self._check_alerts(now_iso)
 
         logger.debug(
             f"Signal tracked: {tracking_entry['signal_id']} for {tracking_entry['symbol']}"
         )
 
-    async def track_execution(self, execution_data: Dict[str, Any]):
-        """Track execution details"""
+    def _apply_execution(self, execution_data: Dict[str, Any], timestamp_ns: int):
         execution_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.fromtimestamp(timestamp_ns / 1e9).isoformat(),
             "execution_id": execution_data.get(
-                "execution_id", f"exec_{len(self.execution_tracking)}"
+                "execution_id", f"exec_{self.execution_columns.size}"
             ),
             "signal_id": execution_data.get("signal_id"),
             "execution_type": execution_data.get(
@@ -115,26 +316,54 @@ class ExecutionPerformanceTracker:
             "execution_time_ms": execution_data.get("execution_time_ms", 0),
         }
 
-        self.execution_tracking.append(execution_entry)
+        self._append_tracked(self.execution_tracking, execution_entry)
+        self.execution_columns.append(
+            execution_entry["slippage"],
+            execution_entry["commission"],
+            execution_entry["execution_time_ms"],
+            execution_entry["pnl"],
+        )
 
         logger.debug(f"Execution tracked: {execution_entry['execution_id']}")
 
-    async def _check_alerts(self):
-        """Check for performance alerts"""
+    def _append_tracked(self, buffer: deque, entry: Dict[str, Any]):
+        """Append to a ring buffer, queueing the evicted entry for the spill file"""
+        if self._spill_path and len(buffer) == buffer.maxlen:
+            self._spilled.append(dumps(buffer[0]))
+        buffer.append(entry)
+
+        if self._spilled and time.monotonic() - self._last_spill >= SPILL_INTERVAL:
+            self._write_spill()
+
+    def _write_spill(self):
+        """Append queued evicted entries to the spill file as JSON lines"""
+        self._last_spill = time.monotonic()
+        if not self._spilled:
+            return
+        try:
+            with open(self._spill_path, "ab") as f:
+                f.write(b"\n".join(self._spilled) + b"\n")
+        except OSError:
+            logger.exception("Failed to write tracking spill file %s", self._spill_path)
+        self._spilled = []
+
+    def _check_alerts(self, now_iso: Optional[str] = None):
+        """Check for performance alerts, stamped with the caller's ``now_iso``"""
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
+
         # Check daily loss threshold
-        if self.daily_metrics["total_pnl"] < 0:
-            loss_pct = (
-                abs(self.daily_metrics["total_pnl"]) / 1000000 * 100
-            )  # Assuming 10L capital
-            if loss_pct > self.alert_thresholds["daily_loss_pct"]:
-                alert = {
-                    "type": "daily_loss_exceeded",
-                    "message": f"Daily loss of {loss_pct:.2f}% exceeds threshold of {self.alert_thresholds['daily_loss_pct']}%",
-                    "timestamp": datetime.now().isoformat(),
-                    "severity": "high",
-                }
-                self.daily_metrics["alerts_triggered"].append(alert)
-                logger.warning(alert["message"])
+        total_pnl = self.daily_metrics["total_pnl"]
+        if total_pnl < self._loss_threshold_abs:
+            loss_pct = -total_pnl / self._capital * 100
+            alert = {
+                "type": "daily_loss_exceeded",
+                "message": f"Daily loss of {loss_pct:.2f}% exceeds threshold of {self.alert_thresholds['daily_loss_pct']}%",
+                "timestamp": now_iso,
+                "severity": "high",
+            }
+            self.daily_metrics["alerts_triggered"].append(alert)
+            logger.warning(alert["message"])
 
         # Check success rate
         total_executed = (
@@ -143,21 +372,14 @@ class ExecutionPerformanceTracker:
         )
         if total_executed > 0:
             # For simplicity, assume successful if P&L > 0
-            successful_trades = len(
-                [
-                    t
-                    for t in self.signal_tracking
-                    if t.get("paper_result", {}).get("pnl", 0) > 0
-                ]
-            )
-            success_rate = successful_trades / total_executed
+            success_rate = self._successful_trades / total_executed
             self.daily_metrics["success_rate"] = success_rate
 
-            if success_rate < self.alert_thresholds["low_success_rate"]:
+            if success_rate < self._low_success_rate:
                 alert = {
                     "type": "low_success_rate",
                     "message": f"Success rate of {success_rate:.1%} below threshold of {self.alert_thresholds['low_success_rate']:.1%}",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso,
                     "severity": "medium",
                 }
                 self.daily_metrics["alerts_triggered"].append(alert)
@@ -165,6 +387,9 @@ class ExecutionPerformanceTracker:
 
     async def generate_daily_report(self) -> Dict[str, Any]:
         """Generate comprehensive daily performance report"""
+        await self.flush()
+        self._write_spill()
+
         # Finalize daily metrics
         self.daily_metrics["session_end"] = datetime.now().isoformat()
 
@@ -174,8 +399,8 @@ class ExecutionPerformanceTracker:
         report = {
             "summary": self.daily_metrics,
             "analytics": analytics,
-            "signal_details": self.signal_tracking,
-            "execution_details": self.execution_tracking,
+            "signal_details": list(self.signal_tracking),
+            "execution_details": list(self.execution_tracking),
             "alerts": self.daily_metrics["alerts_triggered"],
         }
 
@@ -191,6 +416,17 @@ class ExecutionPerformanceTracker:
 
         return report
 
+    async def to_json(self, report: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        Serialize a daily report as UTF-8 JSON
+
+        Pass a report already built from generate_daily_report (and possibly
+        extended by the caller); otherwise one is generated.
+        """
+        if report is None:
+            report = await self.generate_daily_report()
+        return dumps(report)
+
     async def _calculate_analytics(self) -> Dict[str, Any]:
         """Calculate detailed performance analytics"""
         analytics = {
@@ -201,45 +437,23 @@ class ExecutionPerformanceTracker:
         }
 
         # Signal analytics
-        if self.signal_tracking:
-            signals_by_strategy = {}
-            signals_by_symbol = {}
-
-            for signal in self.signal_tracking:
-                strategy = signal.get("strategy", "unknown")
-                symbol = signal.get("symbol", "unknown")
-
-                if strategy not in signals_by_strategy:
-                    signals_by_strategy[strategy] = {"count": 0, "pnl": 0}
-                if symbol not in signals_by_symbol:
-                    signals_by_symbol[symbol] = {"count": 0, "pnl": 0}
-
-                signals_by_strategy[strategy]["count"] += 1
-                signals_by_symbol[symbol]["count"] += 1
-
-                paper_pnl = signal.get("paper_result", {}).get("pnl", 0)
-                signals_by_strategy[strategy]["pnl"] += paper_pnl
-                signals_by_symbol[symbol]["pnl"] += paper_pnl
-
-            analytics["strategy_performance"] = signals_by_strategy
-            analytics["symbol_performance"] = signals_by_symbol
+        if self.signal_columns.size:
+            analytics["strategy_performance"] = (
+                self.signal_columns.strategy_performance()
+            )
+            analytics["symbol_performance"] = self.signal_columns.symbol_performance()
 
         # Execution analytics
-        if self.execution_tracking:
-            total_slippage = sum(exec["slippage"] for exec in self.execution_tracking)
-            total_commission = sum(
-                exec["commission"] for exec in self.execution_tracking
-            )
-            avg_execution_time = sum(
-                exec["execution_time_ms"] for exec in self.execution_tracking
-            ) / len(self.execution_tracking)
+        executions = self.execution_columns
+        if executions.size:
+            totals = executions.totals()
 
             analytics["execution_analytics"] = {
-                "total_executions": len(self.execution_tracking),
-                "total_slippage": total_slippage,
-                "total_commission": total_commission,
-                "avg_execution_time_ms": avg_execution_time,
-                "avg_slippage_per_trade": total_slippage / len(self.execution_tracking),
+                "total_executions": executions.size,
+                "total_slippage": totals["slippage"],
+                "total_commission": totals["commission"],
+                "avg_execution_time_ms": totals["execution_time_ms"] / executions.size,
+                "avg_slippage_per_trade": totals["slippage"] / executions.size,
             }
 
         return analytics
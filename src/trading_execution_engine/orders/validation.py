@@ -6,7 +6,7 @@ This module provides utilities for validating orders before submission to broker
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 
 class OrderType(Enum):
@@ -34,7 +34,7 @@ class TimeInForce(Enum):
     FOK = "FOK"  # Fill or Kill
 
 
-@dataclass
+@dataclass(frozen=True)
 class ValidationError:
     """Represents an order validation error."""
 
@@ -43,27 +43,41 @@ class ValidationError:
     severity: str  # 'error' or 'warning'
 
 
-@dataclass
+@dataclass(frozen=True)
 class ValidationResult:
     """Result of order validation."""
 
     is_valid: bool
-    errors: List[ValidationError]
-    warnings: List[ValidationError]
+    errors: Tuple[ValidationError, ...]
+    warnings: Tuple[ValidationError, ...]
 
 
-def validate_order(order: Dict[str, Union[str, float, int]]) -> ValidationResult:
-    """
-    Validate a trading order before submission.
+# Accepted enum values, precomputed for membership tests
+VALID_DIRECTIONS = frozenset(d.value for d in OrderDirection)
+VALID_ORDER_TYPES = frozenset(t.value for t in OrderType)
+VALID_TIME_IN_FORCE = frozenset(tif.value for tif in TimeInForce)
 
-    Args:
-        order: Dictionary with order details
+# Numeric types accepted for quantities and prices
+_NUMBER_TYPES = (int, float)
 
-    Returns:
-        ValidationResult object with validation status and any errors/warnings
+# Shared, immutable result for orders with no errors or warnings
+_OK_RESULT = ValidationResult(is_valid=True, errors=(), warnings=())
+
+# Quantities above this raise a large-order warning
+LARGE_ORDER_QUANTITY = 10000
+
+
+def _validate_order_detailed(
+    order: Dict[str, Union[str, float, int]],
+) -> ValidationResult:
+    """
+    Run every order check and collect the resulting errors and warnings.
+
+    This is the slow path behind validate_order, taken for any order its
+    fast checks cannot accept outright.
     """
-    errors = []
-    warnings = []
+    errors: List[ValidationError] = []
+    warnings: List[ValidationError] = []
 
     # Required fields
     required_fields = ["symbol", "quantity", "direction", "order_type"]
@@ -79,7 +93,9 @@ def validate_order(order: Dict[str, Union[str, float, int]]) -> ValidationResult
 
     # If critical fields are missing, return early
     if len(errors) > 0:
-        return ValidationResult(is_valid=False, errors=errors, warnings=warnings)
+        return ValidationResult(
+            is_valid=False, errors=tuple(errors), warnings=tuple(warnings)
+        )
 
     # Validate quantity
     quantity = order.get("quantity", 0)
@@ -94,8 +110,9 @@ def validate_order(order: Dict[str, Union[str, float, int]]) -> ValidationResult
 
     # Validate direction
     direction = order.get("direction", "")
-    valid_directions = [d.value for d in OrderDirection]
-    if direction not in valid_directions:
+    # Non-string values may be unhashable, so type-check before the set lookup
+    if not isinstance(direction, str) or direction not in VALID_DIRECTIONS:
+        valid_directions = [d.value for d in OrderDirection]
         errors.append(
             ValidationError(
                 field="direction",
@@ -106,8 +123,8 @@ def validate_order(order: Dict[str, Union[str, float, int]]) -> ValidationResult
 
     # Validate order type
     order_type = order.get("order_type", "")
-    valid_order_types = [t.value for t in OrderType]
-    if order_type not in valid_order_types:
+    if not isinstance(order_type, str) or order_type not in VALID_ORDER_TYPES:
+        valid_order_types = [t.value for t in OrderType]
         errors.append(
             ValidationError(
                 field="order_type",
@@ -180,8 +197,11 @@ def validate_order(order: Dict[str, Union[str, float, int]]) -> ValidationResult
     # Time in force
     if "time_in_force" in order:
         time_in_force = order.get("time_in_force", "")
-        valid_tif = [tif.value for tif in TimeInForce]
-        if time_in_force not in valid_tif:
+        if (
+            not isinstance(time_in_force, str)
+            or time_in_force not in VALID_TIME_IN_FORCE
+        ):
+            valid_tif = [tif.value for tif in TimeInForce]
             errors.append(
                 ValidationError(
                     field="time_in_force",
@@ -200,7 +220,7 @@ def validate_order(order: Dict[str, Union[str, float, int]]) -> ValidationResult
         )
 
     # Add warnings for large orders
-    if quantity > 10000:
+    if quantity > LARGE_ORDER_QUANTITY:
         warnings.append(
             ValidationError(
                 field="quantity",
@@ -209,7 +229,70 @@ def validate_order(order: Dict[str, Union[str, float, int]]) -> ValidationResult
             )
         )
 
-    return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
+    if not errors and not warnings:
+        return _OK_RESULT
+    return ValidationResult(
+        is_valid=len(errors) == 0, errors=tuple(errors), warnings=tuple(warnings)
+    )
+
+
+# Price fields each order type must carry
+_REQUIRED_PRICES = {
+    OrderType.LIMIT.value: ("limit_price",),
+    OrderType.STOP.value: ("stop_price",),
+    OrderType.STOP_LIMIT.value: ("stop_price", "limit_price"),
+}
+
+
+def validate_order(order: Dict[str, Union[str, float, int]]) -> ValidationResult:
+    """
+    Validate a trading order before submission.
+
+    Well-formed orders are accepted by the straight-line checks below and
+    share one result object; anything else is handed to
+    _validate_order_detailed, which reports every problem found.
+
+    Args:
+        order: Dictionary with order details
+
+    Returns:
+        ValidationResult object with validation status and any errors/warnings
+    """
+    try:
+        symbol = order["symbol"]
+        quantity = order["quantity"]
+        direction = order["direction"]
+        order_type = order["order_type"]
+    except (KeyError, TypeError):
+        return _validate_order_detailed(order)
+
+    if type(symbol) is not str or not 0 < len(symbol) <= 20:
+        return _validate_order_detailed(order)
+    if (
+        not isinstance(quantity, _NUMBER_TYPES)
+        or not 0 < quantity <= LARGE_ORDER_QUANTITY
+    ):
+        return _validate_order_detailed(order)
+    if type(direction) is not str or direction not in VALID_DIRECTIONS:
+        return _validate_order_detailed(order)
+    if type(order_type) is not str or order_type not in VALID_ORDER_TYPES:
+        return _validate_order_detailed(order)
+
+    for field in _REQUIRED_PRICES.get(order_type, ()):
+        if field not in order:
+            return _validate_order_detailed(order)
+    for field in ("limit_price", "stop_price"):
+        if field in order:
+            price = order[field]
+            if not isinstance(price, _NUMBER_TYPES) or price <= 0:
+                return _validate_order_detailed(order)
+
+    if "time_in_force" in order:
+        time_in_force = order["time_in_force"]
+        if type(time_in_force) is not str or time_in_force not in VALID_TIME_IN_FORCE:
+            return _validate_order_detailed(order)
+
+    return _OK_RESULT
 
 
 def validate_orders(
@@ -224,7 +307,4 @@ def validate_orders(
     Returns:
         Dictionary mapping order index to ValidationResult
     """
-    results = {}
-    for idx, order in enumerate(orders):
-        results[idx] = validate_order(order)
-    return results
+    return {idx: validate_order(order) for idx, order in enumerate(orders)}
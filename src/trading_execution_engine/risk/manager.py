@@ -8,25 +8,150 @@ Author: SJ Trading
 Licensed by SJ Trading
 """
 
+import time
+from collections.abc import Mapping
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, NamedTuple
 
+import numpy as np
+
+from ..utils.columns import grow_columns
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+BUY, SELL = "BUY", "SELL"
+_ACTION_SET = frozenset({BUY, SELL})
+
+
+class Violation(NamedTuple):
+    """A recorded risk violation; ``ts_ns`` is epoch time in nanoseconds"""
+
+    ts_ns: int
+    type: str
+    details: Any
+
+
+def _ns_to_iso(ns: int) -> str:
+    """Local-time ISO string for an epoch timestamp in nanoseconds"""
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
+
+class PositionBook(Mapping):
+    """
+    Columnar (structure-of-arrays) store of the open positions
+
+    Quantity, average price and value live in parallel NumPy arrays indexed
+    through a symbol -> row table, so exposure aggregates are single
+    vectorised reductions. Reads through the mapping interface return the
+    same ``{"quantity", "avg_price", "value"}`` dicts as before.
+
+    Values are written through ``set_value`` so the largest position value
+    is tracked incrementally; it is only rescanned after the current
+    maximum shrinks.
+    """
+
+    __slots__ = (
+        "index",
+        "quantity",
+        "avg_price",
+        "value",
+        "size",
+        "_max_value",
+        "_max_dirty",
+    )
+
+    def __init__(self, capacity: int = 64):
+        self.index: Dict[str, int] = {}
+        self.quantity = np.zeros(capacity, dtype=np.float64)
+        self.avg_price = np.zeros(capacity, dtype=np.float64)
+        self.value = np.zeros(capacity, dtype=np.float64)
+        self.size = 0
+        self._max_value = 0.0
+        self._max_dirty = False
+
+    def row(self, symbol: str) -> int:
+        """Row of ``symbol``, adding an empty position (doubling the arrays when full)"""
+        i = self.index.get(symbol)
+        if i is None:
+            if self.size == len(self.value):
+                self._grow()
+            i = self.index[symbol] = self.size
+            self.size = i + 1
+        return i
+
+    def _grow(self):
+        grow_columns(self, ("quantity", "avg_price", "value"), self.size)
+
+    def set_value(self, i: int, value: float):
+        """Set the value of row ``i``, keeping the running maximum current"""
+        previous = self.value[i]
+        self.value[i] = value
+        if value >= self._max_value:
+            self._max_value = value
+        elif previous == self._max_value:
+            self._max_dirty = True  # The maximum shrank; rescan on next read
+
+    def max_value(self) -> float:
+        """Largest single position value (0 with no positions)"""
+        if self._max_dirty:
+            self._max_value = float(self.value[: self.size].max(initial=0.0))
+            self._max_dirty = False
+        return float(self._max_value)
+
+    def total_value(self) -> float:
+        """Sum of all position values"""
+        return float(self.value[: self.size].sum())
+
+    def __getitem__(self, symbol: str) -> Dict[str, Any]:
+        i = self.index[symbol]
+        quantity = float(self.quantity[i])
+        return {
+            # Whole quantities read back as ints; fractional ones are kept
+            "quantity": int(quantity) if quantity.is_integer() else quantity,
+            "avg_price": float(self.avg_price[i]),
+            "value": float(self.value[i]),
+        }
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return self.size
+
 
 class RiskManager:
     """
     Risk management system for trading operations
     """
 
+    __slots__ = (
+        "config",
+        "daily_limits",
+        "current_positions",
+        "daily_pnl",
+        "risk_violations",
+        "_violations_append",
+        "max_position_size_pct",
+        "max_daily_loss_pct",
+        "stop_loss_pct",
+        "max_concentration_pct",
+        "total_capital",
+        "max_daily_loss_abs",
+        "max_position_size_abs",
+        "_neg_max_daily_loss",
+        "_inv_total_capital_x100",
+        "_inv_max_position_size_x100",
+        "_inv_max_daily_loss_x100",
+    )
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.daily_limits = {}
-        self.current_positions = {}
+        self.current_positions = PositionBook()
         self.daily_pnl = 0.0
         self.risk_violations = []
+        self._violations_append = self.risk_violations.append
 
         # Risk parameters
         self.max_position_size_pct = config.get("max_position_size_pct", 5)
@@ -39,23 +164,34 @@ class RiskManager:
 
         logger.info("Risk management system initialized")
 
-    async def reset_daily_limits(self):
+    def reset_daily_limits(self):
         """Reset daily risk limits"""
+        # Derived limits and reciprocals used on the validation path; the
+        # daily_limits dict below only feeds reporting
+        self.max_daily_loss_abs = self.total_capital * self.max_daily_loss_pct * 0.01
+        self.max_position_size_abs = (
+            self.total_capital * self.max_position_size_pct * 0.01
+        )
+        self._neg_max_daily_loss = -self.max_daily_loss_abs
+        self._inv_total_capital_x100 = 100.0 / self.total_capital
+        self._inv_max_position_size_x100 = 100.0 / self.max_position_size_abs
+        self._inv_max_daily_loss_x100 = 100.0 / self.max_daily_loss_abs
+
         self.daily_limits = {
-            "max_daily_loss": self.total_capital * (self.max_daily_loss_pct / 100),
-            "max_position_size": self.total_capital
-            * (self.max_position_size_pct / 100),
+            "max_daily_loss": self.max_daily_loss_abs,
+            "max_position_size": self.max_position_size_abs,
             "trades_count": 0,
             "daily_pnl": 0.0,
-            "violations": [],
         }
 
         self.daily_pnl = 0.0
-        self.risk_violations = []
+        # daily_limits["violations"] is the same list, not a second copy
+        self.risk_violations = self.daily_limits["violations"] = []
+        self._violations_append = self.risk_violations.append
 
         logger.info("Daily risk limits reset")
 
-    async def validate_signal(self, signal: Dict[str, Any]) -> bool:
+    def validate_signal(self, signal: Dict[str, Any]) -> bool:
         """
         Validate a signal against risk parameters
 
@@ -66,60 +202,62 @@ class RiskManager:
         quantity = signal.get("quantity", 0)
         price = signal.get("price", 0)
 
-        # Basic validation
-        if not all([symbol, action in ["BUY", "SELL"], quantity > 0, price > 0]):
+        # Checks run cheapest first and stop at the first failure
+        if not (symbol and action in _ACTION_SET and quantity > 0 and price > 0):
             self._log_violation("invalid_signal_parameters", signal)
             return False
 
+        # Check daily loss limit
+        if self.daily_pnl < self._neg_max_daily_loss:
+            self._log_violation(
+                "daily_loss_limit_exceeded",
+                {
+                    "current_pnl": self.daily_pnl,
+                    "max_loss": self._neg_max_daily_loss,
+                },
+            )
+            return False
+
         # Calculate position value
         position_value = quantity * price
 
         # Check position size limit
-        if position_value > self.daily_limits["max_position_size"]:
+        if position_value > self.max_position_size_abs:
             self._log_violation(
                 "position_size_exceeded",
                 {
                     "signal": signal,
                     "position_value": position_value,
-                    "max_allowed": self.daily_limits["max_position_size"],
-                },
-            )
-            return False
-
-        # Check daily loss limit
-        if self.daily_pnl < -self.daily_limits["max_daily_loss"]:
-            self._log_violation(
-                "daily_loss_limit_exceeded",
-                {
-                    "current_pnl": self.daily_pnl,
-                    "max_loss": -self.daily_limits["max_daily_loss"],
+                    "max_allowed": self.max_position_size_abs,
                 },
             )
             return False
 
         # Check concentration risk
-        if not await self._validate_concentration_risk(symbol, position_value, action):
+        if not self._validate_concentration_risk(symbol, position_value, action):
             return False
 
         # Check stop loss requirements
-        if not await self._validate_stop_loss(signal):
+        if not self._validate_stop_loss(signal, action, price):
             return False
 
-        logger.debug(f"Signal validated: {action} {quantity} {symbol}")
+        logger.debug("Signal validated: %s %s %s", action, quantity, symbol)
         return True
 
-    async def _validate_concentration_risk(
+    def _validate_concentration_risk(
         self, symbol: str, position_value: float, action: str
     ) -> bool:
         """Validate concentration risk limits"""
-        current_exposure = self.current_positions.get(symbol, {}).get("value", 0)
+        positions = self.current_positions
+        i = positions.index.get(symbol)
+        current_exposure = positions.value[i] if i is not None else 0
 
-        if action == "BUY":
+        if action == BUY:
             new_exposure = current_exposure + position_value
         else:
             new_exposure = max(0, current_exposure - position_value)
 
-        concentration_pct = (new_exposure / self.total_capital) * 100
+        concentration_pct = new_exposure * self._inv_total_capital_x100
 
         if concentration_pct > self.max_concentration_pct:
             self._log_violation(
@@ -134,18 +272,18 @@ class RiskManager:
 
         return True
 
-    async def _validate_stop_loss(self, signal: Dict[str, Any]) -> bool:
-        """Validate stop loss requirements"""
+    def _validate_stop_loss(
+        self, signal: Dict[str, Any], action: str, price: float
+    ) -> bool:
+        """Validate stop loss requirements (``action`` already upper-cased)"""
         stop_loss = signal.get("stop_loss")
-        price = signal.get("price", 0)
-        action = signal.get("action", "").upper()
 
         if not stop_loss:
             self._log_violation("missing_stop_loss", signal)
             return False
 
         # Calculate stop loss percentage
-        if action == "BUY":
+        if action == BUY:
             stop_loss_pct = ((price - stop_loss) / price) * 100
         else:
             stop_loss_pct = ((stop_loss - price) / price) * 100
@@ -165,110 +303,101 @@ class RiskManager:
 
     def _log_violation(self, violation_type: str, details: Any):
         """Log a risk violation"""
-        violation = {
-            "timestamp": datetime.now().isoformat(),
-            "type": violation_type,
-            "details": details,
-        }
+        # Stored as epoch ns; formatted only when a summary is generated
+        self._violations_append(Violation(time.time_ns(), violation_type, details))
 
-        self.risk_violations.append(violation)
-        self.daily_limits["violations"].append(violation)
+        logger.warning("Risk violation: %s", violation_type)
 
-        logger.warning(f"Risk violation: {violation_type}")
-
-    async def update_position(
-        self, symbol: str, action: str, quantity: int, price: float
-    ):
+    def update_position(self, symbol: str, action: str, quantity: float, price: float):
         """Update position tracking"""
-        if symbol not in self.current_positions:
-            self.current_positions[symbol] = {"quantity": 0, "avg_price": 0, "value": 0}
-
-        position = self.current_positions[symbol]
+        positions = self.current_positions
+        i = positions.row(symbol)
+        held = float(positions.quantity[i])
 
-        if action.upper() == "BUY":
-            total_quantity = position["quantity"] + quantity
-            total_value = (position["quantity"] * position["avg_price"]) + (
-                quantity * price
-            )
+        action = action.upper()
+        if action == BUY:
+            total_quantity = held + quantity
+            total_value = (held * positions.avg_price[i]) + (quantity * price)
 
-            position["quantity"] = total_quantity
-            position["avg_price"] = (
+            positions.quantity[i] = total_quantity
+            positions.avg_price[i] = (
                 total_value / total_quantity if total_quantity > 0 else 0
             )
-            position["value"] = total_value
+            positions.set_value(i, total_value)
 
-        elif action.upper() == "SELL":
-            position["quantity"] = max(0, position["quantity"] - quantity)
-            if position["quantity"] == 0:
-                position["avg_price"] = 0
-                position["value"] = 0
+        elif action == SELL:
+            positions.quantity[i] = max(0, held - quantity)
+            if positions.quantity[i] == 0:
+                positions.avg_price[i] = 0
+                positions.set_value(i, 0.0)
             else:
-                position["value"] = position["quantity"] * position["avg_price"]
+                positions.set_value(i, positions.quantity[i] * positions.avg_price[i])
 
         logger.debug(
-            f"Position updated: {symbol} - {position['quantity']} @ ₹{position['avg_price']:.2f}"
+            "Position updated: %s - %g @ ₹%.2f",
+            symbol,
+            positions.quantity[i],
+            positions.avg_price[i],
         )
 
-    async def update_pnl(self, pnl_change: float):
+    def update_pnl(self, pnl_change: float):
         """Update daily P&L tracking"""
         self.daily_pnl += pnl_change
         self.daily_limits["daily_pnl"] = self.daily_pnl
 
         # Check if daily loss limit is breached
-        if self.daily_pnl < -self.daily_limits["max_daily_loss"]:
+        if self.daily_pnl < self._neg_max_daily_loss:
             self._log_violation(
                 "daily_loss_limit_breached",
                 {
                     "current_pnl": self.daily_pnl,
-                    "limit": -self.daily_limits["max_daily_loss"],
+                    "limit": self._neg_max_daily_loss,
                 },
             )
 
-    async def generate_daily_summary(self) -> Dict[str, Any]:
+    def generate_daily_summary(self) -> Dict[str, Any]:
         """Generate daily risk management summary"""
+        violations = [
+            {"timestamp": _ns_to_iso(v.ts_ns), "type": v.type, "details": v.details}
+            for v in self.risk_violations
+        ]
         summary = {
             "date": datetime.now().strftime("%Y-%m-%d"),
-            "risk_limits": self.daily_limits,
-            "current_positions": self.current_positions,
+            "risk_limits": {**self.daily_limits, "violations": violations},
+            "current_positions": dict(self.current_positions),
             "daily_pnl": self.daily_pnl,
-            "risk_violations": self.risk_violations,
+            "risk_violations": violations,
             "risk_metrics": {
                 "max_position_utilization_pct": self._calculate_max_position_utilization(),
                 "concentration_risk_pct": self._calculate_concentration_risk(),
                 "daily_loss_utilization_pct": abs(self.daily_pnl)
-                / self.daily_limits["max_daily_loss"]
-                * 100,
+                * self._inv_max_daily_loss_x100,
                 "total_violations": len(self.risk_violations),
             },
         }
 
         logger.info(
-            f"Risk summary: {len(self.risk_violations)} violations, "
-            f"P&L: ₹{self.daily_pnl:.2f}, "
-            f"Max position: {summary['risk_metrics']['max_position_utilization_pct']:.1f}%"
+            "Risk summary: %d violations, P&L: ₹%.2f, Max position: %.1f%%",
+            len(self.risk_violations),
+            self.daily_pnl,
+            summary["risk_metrics"]["max_position_utilization_pct"],
         )
 
         return summary
 
     def _calculate_max_position_utilization(self) -> float:
         """Calculate maximum position size utilization"""
-        max_position_value = max(
-            [pos["value"] for pos in self.current_positions.values()], default=0
-        )
-        return (max_position_value / self.daily_limits["max_position_size"]) * 100
+        max_position_value = self.current_positions.max_value()
+        return max_position_value * self._inv_max_position_size_x100
 
     def _calculate_concentration_risk(self) -> float:
         """Calculate concentration risk percentage"""
-        max_exposure = max(
-            [pos["value"] for pos in self.current_positions.values()], default=0
-        )
-        return (max_exposure / self.total_capital) * 100
+        max_exposure = self.current_positions.max_value()
+        return max_exposure * self._inv_total_capital_x100
 
     def get_available_buying_power(self) -> float:
         """Get available buying power considering risk limits"""
-        total_position_value = sum(
-            pos["value"] for pos in self.current_positions.values()
-        )
+        total_position_value = self.current_positions.total_value()
         remaining_capital = self.total_capital - total_position_value
 
         # Consider daily loss impact
@@ -280,7 +409,7 @@ class RiskManager:
     def is_trading_halted(self) -> bool:
         """Check if trading should be halted due to risk limits"""
         # Halt if daily loss limit exceeded
-        if self.daily_pnl < -self.daily_limits["max_daily_loss"]:
+        if self.daily_pnl < self._neg_max_daily_loss:
             return True
 
         # Halt if too many violations
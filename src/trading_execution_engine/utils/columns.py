@@ -0,0 +1,21 @@
+"""
+Helpers for the growable NumPy column buffers used by the columnar stores.
+"""
+
+from typing import Any, Iterable
+
+import numpy as np
+
+
+def grow_columns(owner: Any, names: Iterable[str], size: int):
+    """
+    Double the capacity of the named NumPy array attributes of ``owner``
+
+    The first ``size`` rows are copied over and the new rows are zeroed.
+    Trailing dimensions and dtypes are kept.
+    """
+    for name in names:
+        column = getattr(owner, name)
+        grown = np.zeros((2 * len(column),) + column.shape[1:], dtype=column.dtype)
+        grown[:size] = column[:size]
+        setattr(owner, name, grown)
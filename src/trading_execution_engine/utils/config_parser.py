@@ -12,11 +12,71 @@ Author: AI Trading Machine
 Licensed by SJ Trading
 """
 
-import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
+from .json_utils import loads
+
+# Default NIFTY 50 constituents, used when configs/nifty50.json is absent
+_NIFTY50_SYMBOLS: tuple[str, ...] = (
+    "RELIANCE",
+    "TCS",
+    "HDFCBANK",
+    "BHARTIARTL",
+    "ICICIBANK",
+    "INFOSYS",
+    "SBIN",
+    "LICI",
+    "ITC",
+    "HINDUNILVR",
+    "LT",
+    "HCLTECH",
+    "MARUTI",
+    "SUNPHARMA",
+    "BAJFINANCE",
+    "ONGC",
+    "COALINDIA",
+    "NTPC",
+    "ASIANPAINT",
+    "M&M",
+    "NESTLEIND",
+    "WIPRO",
+    "ULTRACEMCO",
+    "ADANIENT",
+    "JSWSTEEL",
+    "POWERGRID",
+    "AXISBANK",
+    "BAJAJFINSV",
+    "KOTAKBANK",
+    "TITAN",
+    "INDUSINDBK",
+    "TECHM",
+    "GRASIM",
+    "HDFCLIFE",
+    "ADANIPORTS",
+    "TATACONSUM",
+    "HINDALCO",
+    "TATAMOTORS",
+    "CIPLA",
+    "SBILIFE",
+    "BAJAJ-AUTO",
+    "BPCL",
+    "EICHERMOT",
+    "APOLLOHOSP",
+    "HEROMOTOCO",
+    "DRREDDY",
+    "BRITANNIA",
+    "TATASTEEL",
+    "DIVISLAB",
+    "UPL",
+)
+
+
+# Cached marker for keys that resolved to nothing (the caller's default applies)
+_MISSING = object()
+
 
 class ConfigParser:
     """
@@ -32,6 +92,12 @@ class ConfigParser:
         """
         self.config = {}
         self.config_file = config_file
+        # Resolved values per (key, env_var) and dot-split keys; cleared
+        # whenever the configuration changes
+        self._cache: dict[tuple[str, Optional[str]], Any] = {}
+        self._split_cache: dict[str, tuple[str, ...]] = {}
+        # Environment snapshot; the process environment is fixed at runtime
+        self._env: dict[str, str] = dict(os.environ)
 
         if config_file and os.path.exists(config_file):
             self.load_from_file(config_file)
@@ -39,8 +105,9 @@ class ConfigParser:
     def load_from_file(self, file_path: str) -> None:
         """Load configuration from JSON file."""
         try:
-            with open(file_path) as f:
-                self.config = json.load(f)
+            with open(file_path, "rb") as f:
+                self.config = loads(f.read())
+            self._cache.clear()
         except Exception as e:
             raise ValueError("Failed to load config from {file_path}: {e}")
 
@@ -56,22 +123,40 @@ class ConfigParser:
         Returns:
             Configuration value
         """
-        # Check environment variable first
-        if env_var and os.getenv(env_var):
-            return os.getenv(env_var)
+        cache_key = (key, env_var)
+        try:
+            value = self._cache[cache_key]
+        except KeyError:
+            value = self._cache[cache_key] = self._resolve(key, env_var)
+
+        return default if value is _MISSING else value
+
+    def _resolve(self, key: str, env_var: Optional[str]) -> Any:
+        """Resolve ``key`` from the environment or the config, or ``_MISSING``."""
+        env = self._env
+
+        # Check environment variable first (empty values count as unset)
+        if env_var:
+            env_value = env.get(env_var)
+            if env_value:
+                return env_value
 
         # Check environment variable with key name
-        env_key = key.upper().replace(".", "_")
-        if os.getenv(env_key):
-            return os.getenv(env_key)
+        env_value = env.get(key.upper().replace(".", "_"))
+        if env_value:
+            return env_value
+
+        parts = self._split_cache.get(key)
+        if parts is None:
+            parts = self._split_cache[key] = tuple(key.split("."))
 
         # Navigate nested dictionary using dot notation
         value = self.config
-        for part in key.split("."):
+        for part in parts:
             if isinstance(value, dict) and part in value:
                 value = value[part]
             else:
-                return default
+                return _MISSING
 
         return value
 
@@ -86,6 +171,12 @@ class ConfigParser:
             current = current[k]
 
         current[keys[-1]] = value
+        self._cache.clear()
+
+    def refresh_env(self) -> None:
+        """Re-read the process environment (e.g. after tests modify it)."""
+        self._env = dict(os.environ)
+        self._cache.clear()
 
     def to_dict(self) -> dict[str, Any]:
         """Return configuration as dictionary."""
@@ -126,21 +217,27 @@ def load_nifty50_config() -> list[str]:
     Returns:
         List of NIFTY 50 stock symbols
     """
+    return list(_load_nifty50_symbols())
+
+
+@lru_cache(maxsize=1)
+def _load_nifty50_symbols() -> tuple[str, ...]:
+    """Read the NIFTY 50 symbols once; the config file is read-only at runtime."""
     try:
         project_root = Path(__file__).parent.parent.parent.parent
         nifty50_file = project_root / "configs" / "nifty50.json"
 
         if nifty50_file.exists():
-            with open(nifty50_file) as f:
-                data = json.load(f)
-                return data.get("symbols", [])
+            with open(nifty50_file, "rb") as f:
+                data = loads(f.read())
+                return tuple(data.get("symbols", []))
         else:
             # Default NIFTY 50 symbols if file not found
-            return get_default_nifty50_symbols()
+            return _NIFTY50_SYMBOLS
 
     except Exception as e:
         print("Error loading NIFTY 50 config: {e}")
-        return get_default_nifty50_symbols()
+        return _NIFTY50_SYMBOLS
 
 
 def get_default_nifty50_symbols() -> list[str]:
@@ -150,58 +247,7 @@ def get_default_nifty50_symbols() -> list[str]:
     Returns:
         List of NIFTY 50 stock symbols
     """
-    return [
-        "RELIANCE",
-        "TCS",
-        "HDFCBANK",
-        "BHARTIARTL",
-        "ICICIBANK",
-        "INFOSYS",
-        "SBIN",
-        "LICI",
-        "ITC",
-        "HINDUNILVR",
-        "LT",
-        "HCLTECH",
-        "MARUTI",
-        "SUNPHARMA",
-        "BAJFINANCE",
-        "ONGC",
-        "COALINDIA",
-        "NTPC",
-        "ASIANPAINT",
-        "M&M",
-        "NESTLEIND",
-        "WIPRO",
-        "ULTRACEMCO",
-        "ADANIENT",
-        "JSWSTEEL",
-        "POWERGRID",
-        "AXISBANK",
-        "BAJAJFINSV",
-        "KOTAKBANK",
-        "TITAN",
-        "INDUSINDBK",
-        "TECHM",
-        "GRASIM",
-        "HDFCLIFE",
-        "ADANIPORTS",
-        "TATACONSUM",
-        "HINDALCO",
-        "TATAMOTORS",
-        "CIPLA",
-        "SBILIFE",
-        "BAJAJ-AUTO",
-        "BPCL",
-        "EICHERMOT",
-        "APOLLOHOSP",
-        "HEROMOTOCO",
-        "DRREDDY",
-        "BRITANNIA",
-        "TATASTEEL",
-        "DIVISLAB",
-        "UPL",
-    ]
+    return list(_NIFTY50_SYMBOLS)
 
 
 def get_trading_config() -> dict[str, Any]:
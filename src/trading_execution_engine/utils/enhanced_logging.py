@@ -5,14 +5,70 @@ Enhanced Error Logging System
 Provides concise, focused error tracking and logging to improve GA log usability.
 """
 
+import atexit
+import heapq
+import json
 import logging
 import os
 import sys
+import threading
+import time
 import traceback
+from collections import defaultdict
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import IO, Any, Optional
+
+# Shared read-only default for errors without exception info (never mutated)
+_NO_EXCEPTION: dict[str, Any] = {}
+
+# EnhancedLogger instances by (name, level), shared by get_enhanced_logger
+_LOGGER_CACHE: dict[tuple[str, "LogLevel"], "EnhancedLogger"] = {}
+
+
+@lru_cache(maxsize=None)
+def _log_dir(path: str) -> Path:
+    """Create a log directory once per process and return it"""
+    log_dir = Path(path)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    return log_dir
+
+
+# Errors JSONL shared by every EnhancedLogger, reopened when the date changes
+_error_sink: Optional[IO[str]] = None
+_error_sink_date = ""
+_error_sink_lock = threading.Lock()
+
+
+def _write_error_record(record: str):
+    """Append one record to today's errors JSONL and flush it"""
+    global _error_sink, _error_sink_date
+    today = datetime.now().strftime("%Y%m%d")
+    with _error_sink_lock:
+        if _error_sink is None or _error_sink_date != today:
+            if _error_sink is not None:
+                _error_sink.close()
+            error_file = _log_dir("logs/errors") / f"errors_{today}.jsonl"
+            _error_sink = open(error_file, "a", encoding="utf-8")
+            _error_sink_date = today
+        _error_sink.write(record)
+        _error_sink.flush()
+
+
+@atexit.register
+def _close_error_sink():
+    """Close the shared errors JSONL at interpreter exit"""
+    with _error_sink_lock:
+        if _error_sink is not None:
+            _error_sink.close()
+
+
+@lru_cache(maxsize=256)
+def _code_file(code) -> str:
+    """Base file name of a code object, cached per code object"""
+    return os.path.basename(code.co_filename)
 
 
 class LogLevel(Enum):
@@ -24,6 +80,8 @@ class LogLevel(Enum):
 class EnhancedLogger:
     """Enhanced logger with concise error tracking"""
 
+    __slots__ = ("name", "log_level", "logger")
+
     def __init__(self, name: str, log_level: LogLevel = LogLevel.CONCISE):
         self.name = name
         self.log_level = log_level
@@ -32,9 +90,12 @@ class EnhancedLogger:
 
     def setup_logging(self):
         """Setup enhanced logging configuration"""
+        # Loggers are shared per name; attach handlers only once
+        if self.logger.handlers:
+            return
+
         # Create logs directory
-        log_dir = Path("logs/enhanced")
-        log_dir.mkdir(parents=True, exist_ok=True)
+        log_dir = _log_dir("logs/enhanced")
 
         # Configure formatter based on log level
         if self.log_level == LogLevel.CONCISE:
@@ -49,7 +110,7 @@ class EnhancedLogger:
 
         # File handler for all logs
         file_handler = logging.FileHandler(
-            log_dir / "{self.name}_{datetime.now().strftime('%Y%m%d')}.log"
+            log_dir / f"{self.name}_{datetime.now().strftime('%Y%m%d')}.log"
         )
         file_handler.setFormatter(formatter)
         file_handler.setLevel(logging.DEBUG)
@@ -64,7 +125,7 @@ class EnhancedLogger:
 
         # Error file handler for errors only
         error_handler = logging.FileHandler(
-            log_dir / "{self.name}_errors_{datetime.now().strftime('%Y%m%d')}.log"
+            log_dir / f"{self.name}_errors_{datetime.now().strftime('%Y%m%d')}.log"
         )
         error_handler.setFormatter(formatter)
         error_handler.setLevel(logging.ERROR)
@@ -102,23 +163,24 @@ class EnhancedLogger:
                 if tb:
                     last_frame = tb[-1]
                     error_info["location"] = (
-                        "{last_frame.filename}:{last_frame.lineno} in {last_frame.name}"
+                        f"{last_frame.filename}:{last_frame.lineno} in {last_frame.name}"
                     )
 
         # Log concise error
+        log_format = "❌ %s"
+        log_args: list[Any] = [message]
         if self.log_level == LogLevel.CONCISE:
-            log_message = "❌ {message}"
             if exception:
-                log_message += " | {type(exception).__name__}: {str(exception)}"
+                log_format += " | %s: %s"
+                log_args += (type(exception).__name__, exception)
             if "location" in error_info:
-                log_message += " | {error_info['location']}"
-        else:
-            log_message = "❌ {message}"
-            if exception:
-                log_message += "\nException: {exception}"
-                log_message += "\nTraceback:\n{traceback.format_exc()}"
+                log_format += " | %s"
+                log_args.append(error_info["location"])
+        elif exception:
+            log_format += "\nException: %s\nTraceback:\n%s"
+            log_args += (exception, error_info["traceback"])
 
-        self.logger.error(log_message)
+        self.logger.error(log_format, *log_args)
 
         # Save detailed error info to file
         self._save_error_details(error_info)
@@ -126,72 +188,69 @@ class EnhancedLogger:
     def log_function_entry(self, func_name: str, args: Optional[dict] = None):
         """Log function entry with minimal noise"""
         if self.log_level != LogLevel.CONCISE:
-            message = "🔄 Entering {func_name}"
             if args:
-                message += " | Args: {args}"
-            self.logger.debug(message)
+                self.logger.debug("🔄 Entering %s | Args: %s", func_name, args)
+            else:
+                self.logger.debug("🔄 Entering %s", func_name)
 
     def log_function_exit(self, func_name: str, result: Optional[Any] = None):
         """Log function exit with minimal noise"""
         if self.log_level != LogLevel.CONCISE:
-            message = "✅ Exiting {func_name}"
             if result is not None:
-                message += " | Result type: {type(result).__name__}"
-            self.logger.debug(message)
+                self.logger.debug(
+                    "✅ Exiting %s | Result type: %s",
+                    func_name,
+                    type(result).__name__,
+                )
+            else:
+                self.logger.debug("✅ Exiting %s", func_name)
 
     def log_progress(self, message: str, current: int, total: int):
         """Log progress with clean formatting"""
         percentage = (current / total) * 100 if total > 0 else 0
-        progress_msg = "📊 {message} | {current}/{total} ({percentage:.1f}%)"
-        self.logger.info(progress_msg)
+        self.logger.info("📊 %s | %s/%s (%.1f%%)", message, current, total, percentage)
 
     def log_performance(
-        self, operation: str, duration: float, details: Optional[dict] = None
+        self, operation: str, duration_ns: int, details: Optional[dict] = None
     ):
-        """Log performance metrics concisely"""
-        perf_msg = "⏱️ {operation} | {duration:.3f}s"
+        """Log performance metrics concisely (duration in nanoseconds)"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        duration = duration_ns * 1e-9
         if details:
-            perf_msg += " | {details}"
-        self.logger.info(perf_msg)
+            self.logger.info("⏱️ %s | %.3fs | %s", operation, duration, details)
+        else:
+            self.logger.info("⏱️ %s | %.3fs", operation, duration)
 
     def _get_caller_info(self) -> dict[str, Any]:
         """Get concise caller information"""
         frame = sys._getframe(2)  # Go back 2 frames to get actual caller
         return {
-            "file": os.path.basename(frame.f_code.co_filename),
+            "file": _code_file(frame.f_code),
             "function": frame.f_code.co_name,
             "line": frame.f_lineno,
         }
 
     def _save_error_details(self, error_info: dict[str, Any]):
-        """Save detailed error info for debugging"""
-        error_dir = Path("logs/errors")
-        error_dir.mkdir(parents=True, exist_ok=True)
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%")[:-3]
-        error_file = error_dir / f"error_{timestamp}.json"
-
-        import json
-
-        with open(error_file, "w") as f:
-            json.dump(error_info, f, indent=2, default=str)
+        """Append detailed error info, one JSON object per line"""
+        _write_error_record(json.dumps(error_info, default=str) + "\n")
 
     def info(self, message: str):
         """Log info message"""
-        self.logger.info("ℹ️ {message}")
+        self.logger.info("ℹ️ %s", message)
 
     def warning(self, message: str):
         """Log warning message"""
-        self.logger.warning("⚠️ {message}")
+        self.logger.warning("⚠️ %s", message)
 
     def debug(self, message: str):
         """Log debug message"""
         if self.log_level != LogLevel.CONCISE:
-            self.logger.debug("🔍 {message}")
+            self.logger.debug("🔍 %s", message)
 
     def success(self, message: str):
         """Log success message"""
-        self.logger.info("✅ {message}")
+        self.logger.info("✅ %s", message)
 
 
 # Factory function to create enhanced loggers
@@ -202,34 +261,39 @@ def get_enhanced_logger(name: str, log_level: str = "concise") -> EnhancedLogger
     except ValueError:
         level = LogLevel.CONCISE
 
-    return EnhancedLogger(name, level)
+    logger = _LOGGER_CACHE.get((name, level))
+    if logger is None:
+        logger = _LOGGER_CACHE[name, level] = EnhancedLogger(name, level)
+    return logger
 
 
 # Context manager for function logging
 class LoggedFunction:
     """Context manager for automatic function entry/exit logging"""
 
+    __slots__ = ("logger", "func_name", "args", "start_ns")
+
     def __init__(
         self, logger: EnhancedLogger, func_name: str, args: Optional[dict] = None
     ):
         self.logger = logger
         self.func_name = func_name
         self.args = args
-        self.start_time = None
+        self.start_ns = 0
 
     def __enter__(self):
-        self.start_time = datetime.now()
+        self.start_ns = time.perf_counter_ns()
         self.logger.log_function_entry(self.func_name, self.args)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = (datetime.now() - self.start_time).total_seconds()
+        duration_ns = time.perf_counter_ns() - self.start_ns
 
         if exc_type is not None:
-            self.logger.log_error("Function {self.func_name} failed", exc_val)
+            self.logger.log_error(f"Function {self.func_name} failed", exc_val)
         else:
             self.logger.log_function_exit(self.func_name)
-            self.logger.log_performance(self.func_name, duration)
+            self.logger.log_performance(self.func_name, duration_ns)
 
 
 # Decorator for automatic function logging
@@ -237,9 +301,9 @@ def logged_function(logger_name: str = None, log_level: str = "concise"):
     """Decorator to automatically log function entry, exit, and errors"""
 
     def decorator(func):
-        def wrapper(*args, **kwargs):
-            logger = get_enhanced_logger(logger_name or func.__module__, log_level)
+        logger = get_enhanced_logger(logger_name or func.__module__, log_level)
 
+        def wrapper(*args, **kwargs):
             with LoggedFunction(
                 logger,
                 func.__name__,
@@ -257,41 +321,44 @@ def logged_function(logger_name: str = None, log_level: str = "concise"):
     return decorator
 
 
+def _new_error_pattern() -> dict[str, Any]:
+    """Empty aggregate for a newly seen error pattern"""
+    return {"count": 0, "first_seen": None, "last_seen": None, "examples": []}
+
+
 # Error aggregation for GA logs
 class ErrorAggregator:
     """Aggregates and summarizes errors for GA log analysis"""
 
     def __init__(self):
         self.errors = []
-        self.error_patterns = {}
+        self.error_patterns = defaultdict(_new_error_pattern)
 
     def add_error(self, error_info: dict[str, Any]):
         """Add an error to the aggregator"""
         self.errors.append(error_info)
 
         # Group by error type and message pattern
-        error_type = error_info.get("exception", {}).get("type", "Unknown")
+        error_type = error_info.get("exception", _NO_EXCEPTION).get("type", "Unknown")
         error_pattern = self._extract_pattern(error_info.get("message", ""))
 
-        key = "{error_type}:{error_pattern}"
-        if key not in self.error_patterns:
-            self.error_patterns[key] = {
-                "count": 0,
-                "first_seen": error_info.get("timestamp"),
-                "last_seen": error_info.get("timestamp"),
-                "examples": [],
-            }
+        timestamp = error_info.get("timestamp")
+        pattern = self.error_patterns[f"{error_type}:{error_pattern}"]
+        if not pattern["count"]:
+            pattern["first_seen"] = timestamp
 
-        self.error_patterns[key]["count"] += 1
-        self.error_patterns[key]["last_seen"] = error_info.get("timestamp")
+        pattern["count"] += 1
+        pattern["last_seen"] = timestamp
 
-        if len(self.error_patterns[key]["examples"]) < 3:
-            self.error_patterns[key]["examples"].append(error_info)
+        if len(pattern["examples"]) < 3:
+            pattern["examples"].append(error_info)
 
-    def _extract_pattern(self, message: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _extract_pattern(message: str) -> str:
         """Extract error pattern from message"""
         # Simple pattern extraction - could be enhanced
-        words = message.split()[:5]  # First 5 words
+        words = message.split(None, 5)[:5]  # First 5 words, splitting no further
         return " ".join(words)
 
     def get_summary(self) -> dict[str, Any]:
@@ -299,9 +366,9 @@ class ErrorAggregator:
         return {
             "total_errors": len(self.errors),
             "unique_patterns": len(self.error_patterns),
-            "top_errors": sorted(
-                self.error_patterns.items(), key=lambda x: x[1]["count"], reverse=True
-            )[:10],
+            "top_errors": heapq.nlargest(
+                10, self.error_patterns.items(), key=lambda x: x[1]["count"]
+            ),
             "summary_timestamp": datetime.now().isoformat(),
         }
 
@@ -6,6 +6,7 @@ Standardized Error Handling Framework
 Provides consistent error handling patterns across the AI Trading Machine.
 """
 
+import atexit
 import json
 import logging
 import os
@@ -15,8 +16,15 @@ from enum import Enum
 from functools import wraps
 from typing import Any, Callable, Optional
 
+from .json_utils import dumps, loads
+
 logger = logging.getLogger(__name__)
 
+# Critical alerts are appended here, one JSON object per line
+CRITICAL_ALERTS_FILE = "logs/critical_alerts/critical_alerts.jsonl"
+
+_alert_stream = None  # Line-buffered handle, opened on the first alert
+
 
 class ErrorSeverity(Enum):
     """Error severity levels"""
@@ -30,6 +38,9 @@ class ErrorSeverity(Enum):
 class TradingSystemError(Exception):
     """Base exception for trading system errors"""
 
+    # Slots keep these off the lazily created instance __dict__
+    __slots__ = ("severity", "component", "context", "timestamp")
+
     def __init__(
         self,
         message: str,
@@ -43,10 +54,17 @@ class TradingSystemError(Exception):
         self.context = context or {}
         self.timestamp = datetime.now().isoformat()
 
+    def __reduce__(self):
+        # Slot values are not in BaseException's default pickled state
+        state = {name: getattr(self, name) for name in TradingSystemError.__slots__}
+        return type(self).__new__, (type(self), *self.args), state
+
 
 class CriticalSystemError(TradingSystemError):
     """Critical system error that requires immediate attention"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -59,6 +77,8 @@ class CriticalSystemError(TradingSystemError):
 class DataValidationError(TradingSystemError):
     """Data validation error"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -66,13 +86,15 @@ class DataValidationError(TradingSystemError):
         context: Optional[dict[str, Any]] = None,
     ):
         super().__init__(
-            message, ErrorSeverity.HIGH, "data_validation_{data_source}", context
+            message, ErrorSeverity.HIGH, f"data_validation_{data_source}", context
         )
 
 
 class ConfigurationError(TradingSystemError):
     """Configuration error"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -80,7 +102,7 @@ class ConfigurationError(TradingSystemError):
         context: Optional[dict[str, Any]] = None,
     ):
         super().__init__(
-            message, ErrorSeverity.HIGH, "config_{config_component}", context
+            message, ErrorSeverity.HIGH, f"config_{config_component}", context
         )
 
 
@@ -93,19 +115,18 @@ def fail_fast_on_critical(func: Callable) -> Callable:
             return func(*args, **kwargs)
         except CriticalSystemError as e:
             logger = logging.getLogger(func.__module__)
-            logger.critical("CRITICAL ERROR in {func.__name__}: {e}")
-            logger.critical("Component: {e.component}")
-            logger.critical("Context: {e.context}")
-            logger.critical("Traceback: {traceback.format_exc()}")
+            # exc_info defers traceback formatting to the handler that emits it
+            logger.critical("CRITICAL ERROR in %s: %s", func.__name__, e, exc_info=True)
+            logger.critical("Component: %s", e.component)
+            logger.critical("Context: %s", e.context)
 
             # Trigger alerts and shutdown
             _trigger_critical_alert(e, func.__name__)
             sys.exit(1)
         except Exception as e:
             logger = logging.getLogger(func.__module__)
-            logger.error("Unexpected error in {func.__name__}: {e}")
-            logger.error("Traceback: {traceback.format_exc()}")
-            raise TradingSystemError("Unexpected error in {func.__name__}: {e}")
+            logger.error("Unexpected error in %s: %s", func.__name__, e, exc_info=True)
+            raise TradingSystemError(f"Unexpected error in {func.__name__}: {e}")
 
     return wrapper
 
@@ -125,21 +146,21 @@ def handle_with_recovery(
                 raise
             except Exception as e:
                 logger = logging.getLogger(func.__module__)
-                logger.warning("Error in {func.__name__}: {e}")
+                logger.warning("Error in %s: %s", func.__name__, e)
                 logger.warning("Attempting recovery...")
 
                 if recovery_func:
                     try:
                         return recovery_func(*args, **kwargs)
                     except Exception as recovery_error:
-                        logger.error("Recovery failed: {recovery_error}")
+                        logger.error("Recovery failed: %s", recovery_error)
 
                 if fallback_value is not None:
-                    logger.warning("Using fallback value: {fallback_value}")
+                    logger.warning("Using fallback value: %s", fallback_value)
                     return fallback_value
 
                 # If no recovery possible, convert to system error
-                raise TradingSystemError("Error in {func.__name__}: {e}")
+                raise TradingSystemError(f"Error in {func.__name__}: {e}")
 
         return wrapper
 
@@ -158,12 +179,12 @@ def validate_and_handle(
             try:
                 if not validation_func(*args, **kwargs):
                     raise DataValidationError(
-                        "{error_message} in {func.__name__}",
+                        f"{error_message} in {func.__name__}",
                         context={"args": args, "kwargs": kwargs},
                     )
             except Exception as e:
                 raise DataValidationError(
-                    "Validation error in {func.__name__}: {e}",
+                    f"Validation error in {func.__name__}: {e}",
                     context={"args": args, "kwargs": kwargs},
                 )
 
@@ -187,17 +208,23 @@ def _trigger_critical_alert(error: CriticalSystemError, function_name: str) -> N
             "context": error.context,
         }
 
-        # Write to critical alerts file
-        os.makedirs("logs/critical_alerts", exist_ok=True)
-        alert_file = "logs/critical_alerts/critical_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-
-        with open(alert_file, "w") as f:
-            json.dump(alert_data, f, indent=2)
+        # Append to the critical alerts file
+        _get_alert_stream().write(dumps(alert_data).decode() + "\n")
 
-        print("🚨 CRITICAL ALERT TRIGGERED: {alert_file}")
+        logger.critical("CRITICAL ALERT TRIGGERED: %s", CRITICAL_ALERTS_FILE)
 
     except Exception as alert_error:
-        print("Failed to trigger critical alert: {alert_error}")
+        logger.error("Failed to trigger critical alert: %s", alert_error)
+
+
+def _get_alert_stream():
+    """Open the critical alerts file once and keep it for the process"""
+    global _alert_stream
+    if _alert_stream is None:
+        os.makedirs(os.path.dirname(CRITICAL_ALERTS_FILE), exist_ok=True)
+        _alert_stream = open(CRITICAL_ALERTS_FILE, "a", buffering=1, encoding="utf-8")
+        atexit.register(_alert_stream.close)
+    return _alert_stream
 
 
 # Utility functions for common error handling patterns
@@ -206,15 +233,16 @@ def _trigger_critical_alert(error: CriticalSystemError, function_name: str) -> N
 def safe_json_load(file_path: str, default: Any = None) -> Any:
     """Safely load JSON file with proper error handling"""
     try:
-        with open(file_path) as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return loads(f.read())
     except FileNotFoundError:
-        logger.warning("JSON file not found: {file_path}")
+        logger.warning("JSON file not found: %s", file_path)
         return default
     except json.JSONDecodeError as e:
-        raise DataValidationError("Invalid JSON in {file_path}: {e}")
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        raise DataValidationError(f"Invalid JSON in {file_path}: {e}")
     except Exception as e:
-        raise TradingSystemError("Failed to load JSON {file_path}: {e}")
+        raise TradingSystemError(f"Failed to load JSON {file_path}: {e}")
 
 
 def safe_file_write(file_path: str, content: str, critical: bool = False) -> bool:
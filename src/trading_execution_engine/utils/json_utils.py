@@ -0,0 +1,40 @@
+"""
+JSON helpers shared across the trading execution engine.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: bytes) -> Any:
+    """Parse a JSON document read in one shot as bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize to single-line UTF-8 JSON
+
+    Keys that are not strings (e.g. None) are allowed, NumPy values are
+    serialized natively with orjson, and anything else unsupported is
+    written as its ``str()``.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(obj, default=str).encode()
@@ -9,11 +9,25 @@ Author: AI Trading Machine
 Licensed by SJ Trading
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
-from typing import Optional
+import threading
+from functools import cache, lru_cache
+from typing import List, Optional
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Seconds between forced flushes of the buffered file output
+LOG_FLUSH_INTERVAL = 1.0
+
+# Background listeners that own the file handlers, one per log file
+_LISTENERS: List[logging.handlers.QueueListener] = []
+_STOP_FLUSHING = threading.Event()
 
 
 class Logger:
@@ -47,6 +61,7 @@ class Logger:
         self.logger.critical(message)
 
 
+@lru_cache(maxsize=128)
 def setup_logger(
     name: str,
     level: Optional[str] = None,
@@ -75,15 +90,12 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level))
 
-    # Avoid duplicate handlers
+    # Avoid duplicate handlers (the same name set up with different arguments)
     if logger.handlers:
         return logger
 
     # Create formatter
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
 
     # Console handler
     if console_output:
@@ -102,32 +114,85 @@ def setup_logger(
                 log_dir, "ai_trading_machine_{datetime.now().strftime('%Y%m%d')}.log"
             )
 
-        # Rotating file handler (10MB max, keep 5 files)
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file, maxBytes=10 * 1024 * 1024, backupCount=5  # 10MB
-        )
-        file_handler.setLevel(getattr(logging, level))
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        # File writes happen on a listener thread; the caller only enqueues.
+        # Records are filtered by level here, before they are queued
+        queue_handler = logging.handlers.QueueHandler(_file_queue(log_file))
+        queue_handler.setLevel(getattr(logging, level))
+        logger.addHandler(queue_handler)
 
     return logger
 
 
+@lru_cache(maxsize=None)
+def _file_queue(log_file: str) -> queue.Queue:
+    """Queue drained into ``log_file`` by a background QueueListener."""
+    # Rotating file handler (10MB max, keep 5 files)
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=10 * 1024 * 1024, backupCount=5  # 10MB
+    )
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+
+    # Records reach the file in batches: when the buffer fills, on ERROR and
+    # above, every LOG_FLUSH_INTERVAL seconds and on close
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=int(os.getenv("LOG_BUFFER", "512")),
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    threading.Thread(
+        target=_flush_periodically,
+        args=(buffered_handler,),
+        name="log-flush",
+        daemon=True,
+    ).start()
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, buffered_handler)
+    listener.start()
+    _LISTENERS.append(listener)
+    return log_queue
+
+
+def _flush_periodically(handler: logging.Handler):
+    """Flush ``handler`` every LOG_FLUSH_INTERVAL seconds until shutdown."""
+    while not _STOP_FLUSHING.wait(LOG_FLUSH_INTERVAL):
+        handler.flush()
+
+
+@atexit.register
+def stop_listeners():
+    """Drain queued records, flush the buffers and close the log files."""
+    _STOP_FLUSHING.set()
+    while _LISTENERS:
+        listener = _LISTENERS.pop()
+        listener.stop()
+        for handler in listener.handlers:
+            target = handler.target
+            handler.close()  # Flushes the buffer into the file handler
+            target.close()
+    _file_queue.cache_clear()
+
+
+@cache
 def get_trading_logger() -> logging.Logger:
     """Get the main trading logger."""
     return setup_logger("ai_trading_machine.trading")
 
 
+@cache
 def get_backtest_logger() -> logging.Logger:
     """Get the backtesting logger."""
     return setup_logger("ai_trading_machine.backtest")
 
 
+@cache
 def get_data_logger() -> logging.Logger:
     """Get the data ingestion logger."""
     return setup_logger("ai_trading_machine.data")
 
 
+@cache
 def get_strategy_logger() -> logging.Logger:
     """Get the strategy logger."""
     return setup_logger("ai_trading_machine.strategy")
@@ -148,19 +213,14 @@ def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
 
 
 # Configure root logger for the package
+@cache
 def configure_package_logging():
     """Configure logging for the entire AI Trading Machine package."""
     # Set up root logger
     root_logger = setup_logger("ai_trading_machine")
 
     # Suppress verbose logging from external libraries
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("requests").setLevel(logging.WARNING)
-    logging.getLogger("matplotlib").setLevel(logging.WARNING)
-    logging.getLogger("yfinance").setLevel(logging.WARNING)
+    for name in ("urllib3", "requests", "matplotlib", "yfinance"):
+        logging.getLogger(name).setLevel(logging.WARNING)
 
     return root_logger
-
-
-# Auto-configure when module is imported
-configure_package_logging()
@@ -8,14 +8,40 @@ Author: SJ Trading
 Licensed by SJ Trading
 """
 
-import pytz
+import time
+from array import array
+from bisect import bisect_right
 from datetime import datetime, time as dt_time, date
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple
+from zoneinfo import ZoneInfo
 
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Indian timezone, resolved once per process
+IST = ZoneInfo("Asia/Kolkata")
+
+# Seconds the current IST time is reused across default-time queries
+CURRENT_TIME_TTL = 0.5
+
+# Days before/after today covered by the precomputed trading calendar
+TRADING_CALENDAR_PAST_DAYS = 366
+TRADING_CALENDAR_FUTURE_DAYS = 731
+
+
+def _us_of_day(t) -> int:
+    """Microseconds since midnight for a time or datetime"""
+    return ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 + t.microsecond
+
+
+@lru_cache(maxsize=4096)
+def _is_market_day(ordinal: int, holiday_ords: FrozenSet[int]) -> bool:
+    """Trading-day check by date ordinal; ordinal 1 is a Monday"""
+    # (ordinal + 6) % 7 is the weekday (Saturday=5, Sunday=6)
+    return (ordinal + 6) % 7 < 5 and ordinal not in holiday_ords
+
 
 class MarketHoursValidator:
     """
@@ -24,13 +50,18 @@ class MarketHoursValidator:
 
     def __init__(self):
         # Indian timezone
-        self.timezone = pytz.timezone("Asia/Kolkata")
+        self.timezone = IST
 
         # Market timings (IST)
         self.market_open = dt_time(9, 15)  # 9:15 AM
         self.market_close = dt_time(15, 30)  # 3:30 PM
         self.pre_market_start = dt_time(9, 0)  # 9:00 AM
         self.post_market_end = dt_time(16, 0)  # 4:00 PM
+        # Session bounds as microseconds of day; one int compare per check
+        self._open_us = _us_of_day(self.market_open)
+        self._close_us = _us_of_day(self.market_close)
+        self._pre_us = _us_of_day(self.pre_market_start)
+        self._post_us = _us_of_day(self.post_market_end)
 
         # Market holidays (2024-2025) - will be loaded from config in production
         self.market_holidays = {
@@ -49,12 +80,84 @@ class MarketHoursValidator:
             date(2025, 10, 2),  # Gandhi Jayanti
             date(2025, 12, 25),  # Christmas
         }
+        # Integer ordinals hash far cheaper than date objects
+        self._holiday_ords = frozenset(d.toordinal() for d in self.market_holidays)
+        # Session info per date ordinal; callers receive copies
+        self._session_info_cache: Dict[int, dict] = {}
+        # Localized market open/close datetimes per date ordinal
+        self._open_by_ord: Dict[int, datetime] = {}
+        self._close_by_ord: Dict[int, datetime] = {}
+        # (monotonic stamp, today, now) shared by default-time queries
+        self._now_cache: Tuple[float, date, datetime] = (float("-inf"), None, None)
+
+        # Sorted trading-day ordinals around today; next-day lookups bisect
+        # this and only walk day by day outside the covered range
+        today = self._today().toordinal()
+        self._calendar_start = today - TRADING_CALENDAR_PAST_DAYS
+        self._trading_ordinals = array(
+            "i",
+            (
+                ordinal
+                for ordinal in range(
+                    self._calendar_start, today + TRADING_CALENDAR_FUTURE_DAYS
+                )
+                if (ordinal + 6) % 7 < 5 and ordinal not in self._holiday_ords
+            ),
+        )
 
         logger.info("Market hours validator initialized for Indian markets")
 
+    def _localized_open(self, day: date) -> datetime:
+        """Market open on ``day`` in IST, localized once per date"""
+        ordinal = day.toordinal()
+        opens = self._open_by_ord.get(ordinal)
+        if opens is None:
+            opens = self._open_by_ord[ordinal] = datetime.combine(
+                day, self.market_open, tzinfo=self.timezone
+            )
+        return opens
+
+    def _localized_close(self, day: date) -> datetime:
+        """Market close on ``day`` in IST, localized once per date"""
+        ordinal = day.toordinal()
+        closes = self._close_by_ord.get(ordinal)
+        if closes is None:
+            closes = self._close_by_ord[ordinal] = datetime.combine(
+                day, self.market_close, tzinfo=self.timezone
+            )
+        return closes
+
+    def _next_trading_day(self, after: date) -> date:
+        """First market day strictly after ``after``"""
+        ordinal = after.toordinal()
+        trading_ordinals = self._trading_ordinals
+        if ordinal >= self._calendar_start - 1:
+            idx = bisect_right(trading_ordinals, ordinal)
+            if idx < len(trading_ordinals):
+                return date.fromordinal(trading_ordinals[idx])
+
+        # Outside the precomputed calendar
+        while True:
+            ordinal += 1
+            if _is_market_day(ordinal, self._holiday_ords):
+                return date.fromordinal(ordinal)
+
     def get_current_time(self) -> datetime:
-        """Get current time in Indian timezone"""
-        return datetime.now(self.timezone)
+        """Get current time in Indian timezone, refreshed every CURRENT_TIME_TTL"""
+        stamp = time.monotonic()
+        cached = self._now_cache
+        if stamp - cached[0] < CURRENT_TIME_TTL:
+            return cached[2]
+        now = datetime.now(self.timezone)
+        self._now_cache = (stamp, now.date(), now)
+        return now
+
+    def _today(self) -> date:
+        """Current IST date from the same cache as get_current_time"""
+        cached = self._now_cache
+        if time.monotonic() - cached[0] < CURRENT_TIME_TTL:
+            return cached[1]
+        return self.get_current_time().date()
 
     def is_market_day(self, check_date: date = None) -> bool:
         """
@@ -67,17 +170,10 @@ class MarketHoursValidator:
             True if market is open on the given date
         """
         if check_date is None:
-            check_date = self.get_current_time().date()
-
-        # Check if it's a weekday (Monday=0, Sunday=6)
-        if check_date.weekday() >= 5:  # Saturday=5, Sunday=6
-            return False
+            check_date = self._today()
 
-        # Check if it's a market holiday
-        if check_date in self.market_holidays:
-            return False
-
-        return True
+        # Weekday and holiday check, memoized per date
+        return _is_market_day(check_date.toordinal(), self._holiday_ords)
 
     def is_market_open(self, check_time: datetime = None) -> bool:
         """
@@ -92,13 +188,11 @@ class MarketHoursValidator:
         if check_time is None:
             check_time = self.get_current_time()
 
-        # Check if it's a market day
-        if not self.is_market_day(check_time.date()):
+        # Check if current time is within market hours, then the market day
+        current_us = _us_of_day(check_time)
+        if not self._open_us <= current_us <= self._close_us:
             return False
-
-        # Check if current time is within market hours
-        current_time = check_time.time()
-        return self.market_open <= current_time <= self.market_close
+        return self.is_market_day(check_time.date())
 
     def is_pre_market(self, check_time: datetime = None) -> bool:
         """
@@ -113,11 +207,10 @@ class MarketHoursValidator:
         if check_time is None:
             check_time = self.get_current_time()
 
-        if not self.is_market_day(check_time.date()):
+        current_us = _us_of_day(check_time)
+        if not self._pre_us <= current_us < self._open_us:
             return False
-
-        current_time = check_time.time()
-        return self.pre_market_start <= current_time < self.market_open
+        return self.is_market_day(check_time.date())
 
     def is_post_market(self, check_time: datetime = None) -> bool:
         """
@@ -132,11 +225,10 @@ class MarketHoursValidator:
         if check_time is None:
             check_time = self.get_current_time()
 
-        if not self.is_market_day(check_time.date()):
+        current_us = _us_of_day(check_time)
+        if not self._close_us < current_us <= self._post_us:
             return False
-
-        current_time = check_time.time()
-        return self.market_close < current_time <= self.post_market_end
+        return self.is_market_day(check_time.date())
 
     def get_market_status(self, check_time: datetime = None) -> str:
         """
@@ -154,11 +246,13 @@ class MarketHoursValidator:
         if not self.is_market_day(check_time.date()):
             return "MARKET_CLOSED_HOLIDAY"
 
-        if self.is_pre_market(check_time):
-            return "PRE_MARKET"
-        elif self.is_market_open(check_time):
+        # One time-of-day computation, dispatched over the session bounds
+        current_us = _us_of_day(check_time)
+        if current_us < self._open_us:
+            return "PRE_MARKET" if current_us >= self._pre_us else "MARKET_CLOSED"
+        elif current_us <= self._close_us:
             return "MARKET_OPEN"
-        elif self.is_post_market(check_time):
+        elif current_us <= self._post_us:
             return "POST_MARKET"
         else:
             return "MARKET_CLOSED"
@@ -180,18 +274,10 @@ class MarketHoursValidator:
 
         # If market is still open today, return today's market open
         if self.is_market_day(current_date) and from_time.time() < self.market_open:
-            return self.timezone.localize(
-                datetime.combine(current_date, self.market_open)
-            )
+            return self._localized_open(current_date)
 
         # Find next market day
-        check_date = current_date
-        while True:
-            check_date = date.fromordinal(check_date.toordinal() + 1)
-            if self.is_market_day(check_date):
-                return self.timezone.localize(
-                    datetime.combine(check_date, self.market_open)
-                )
+        return self._localized_open(self._next_trading_day(current_date))
 
     def get_next_market_close(self, from_time: datetime = None) -> datetime:
         """
@@ -210,18 +296,10 @@ class MarketHoursValidator:
 
         # If market is open today, return today's market close
         if self.is_market_day(current_date) and from_time.time() < self.market_close:
-            return self.timezone.localize(
-                datetime.combine(current_date, self.market_close)
-            )
+            return self._localized_close(current_date)
 
         # Find next market day
-        check_date = current_date
-        while True:
-            check_date = date.fromordinal(check_date.toordinal() + 1)
-            if self.is_market_day(check_date):
-                return self.timezone.localize(
-                    datetime.combine(check_date, self.market_close)
-                )
+        return self._localized_close(self._next_trading_day(current_date))
 
     def get_trading_minutes_remaining(self, check_time: datetime = None) -> int:
         """
@@ -239,9 +317,7 @@ class MarketHoursValidator:
         if not self.is_market_open(check_time):
             return 0
 
-        market_close_today = self.timezone.localize(
-            datetime.combine(check_time.date(), self.market_close)
-        )
+        market_close_today = self._localized_close(check_time.date())
 
         remaining = market_close_today - check_time
         return max(0, int(remaining.total_seconds() / 60))
@@ -257,7 +333,12 @@ class MarketHoursValidator:
             Dictionary with session information
         """
         if check_date is None:
-            check_date = self.get_current_time().date()
+            check_date = self._today()
+
+        ordinal = check_date.toordinal()
+        cached = self._session_info_cache.get(ordinal)
+        if cached is not None:
+            return dict(cached)
 
         session_info = {
             "date": check_date.isoformat(),
@@ -286,7 +367,8 @@ class MarketHoursValidator:
                 }
             )
 
-        return session_info
+        self._session_info_cache[ordinal] = session_info
+        return dict(session_info)
 
     def validate_trading_time(self, target_time: datetime) -> Tuple[bool, str]:
         """
@@ -0,0 +1,41 @@
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from trading_execution_engine.utils.market_hours import MarketHoursValidator
+
+IST = ZoneInfo("Asia/Kolkata")
+
+
+def _ist(*args):
+    return datetime(*args, tzinfo=IST)
+
+
+def test_market_days_skip_weekends_and_holidays():
+    """Weekends and listed holidays are not trading days."""
+    validator = MarketHoursValidator()
+
+    assert validator.is_market_day(date(2024, 8, 14))  # Wednesday
+    assert not validator.is_market_day(date(2024, 8, 15))  # Independence Day
+    assert not validator.is_market_day(date(2024, 8, 17))  # Saturday
+    assert not validator.is_market_day(date(2024, 8, 18))  # Sunday
+
+
+def test_market_status_and_next_session():
+    """Session boundaries map to the expected status and next open/close."""
+    validator = MarketHoursValidator()
+
+    assert validator.get_market_status(_ist(2024, 8, 14, 8, 59)) == "MARKET_CLOSED"
+    assert validator.get_market_status(_ist(2024, 8, 14, 9, 0)) == "PRE_MARKET"
+    assert validator.get_market_status(_ist(2024, 8, 14, 9, 15)) == "MARKET_OPEN"
+    assert validator.get_market_status(_ist(2024, 8, 14, 15, 30)) == "MARKET_OPEN"
+    assert validator.get_market_status(_ist(2024, 8, 14, 15, 45)) == "POST_MARKET"
+    assert validator.get_market_status(_ist(2024, 8, 14, 16, 1)) == "MARKET_CLOSED"
+    assert (
+        validator.get_market_status(_ist(2024, 8, 15, 10, 0)) == "MARKET_CLOSED_HOLIDAY"
+    )
+
+    # Wednesday after the close: Thursday is a holiday, so Friday opens next
+    after_close = _ist(2024, 8, 14, 15, 45)
+    assert validator.get_next_market_open(after_close) == _ist(2024, 8, 16, 9, 15)
+    assert validator.get_next_market_close(after_close) == _ist(2024, 8, 16, 15, 30)
+    assert validator.get_trading_minutes_remaining(_ist(2024, 8, 14, 15, 0)) == 30
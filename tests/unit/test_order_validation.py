@@ -1,6 +1,7 @@
 import pytest
 from trading_execution_engine.orders.validation import (
     validate_order,
+    validate_orders,
     OrderType,
     OrderDirection,
     TimeInForce,
@@ -87,3 +88,51 @@ def test_validate_order():
     assert result.is_valid  # Still valid despite warning
     assert len(result.warnings) > 0
     assert any(warning.field == "quantity" for warning in result.warnings)
+
+
+def test_validate_orders_matches_validate_order():
+    """Batch validation agrees with per-order validation."""
+    base = {"symbol": "AAPL", "quantity": 100, "direction": "BUY"}
+    orders = [
+        {**base, "order_type": "MARKET"},
+        {**base, "order_type": "LIMIT", "limit_price": 150.50},
+        {**base, "order_type": "LIMIT"},
+        {**base, "order_type": "STOP_LIMIT", "stop_price": 140.0},
+        {**base, "order_type": "MARKET", "limit_price": None},
+        {**base, "order_type": "MARKET", "quantity": 20000},
+        {**base, "order_type": "MARKET", "time_in_force": "XYZ"},
+        {**base, "order_type": "MARKET", "direction": "HOLD"},
+        {"symbol": "AAPL", "direction": "BUY", "order_type": "MARKET"},
+    ] * 10
+
+    results = validate_orders(orders)
+
+    assert list(results) == list(range(len(orders)))
+    assert results == {idx: validate_order(order) for idx, order in enumerate(orders)}
+    assert [results[idx].is_valid for idx in range(9)] == [
+        True,
+        True,
+        False,
+        False,
+        False,
+        True,
+        False,
+        False,
+        False,
+    ]
+
+
+def test_validate_order_rejects_unhashable_enum_fields():
+    """Non-string direction/order_type/time_in_force are errors, not crashes."""
+    base = {"symbol": "AAPL", "quantity": 100, "direction": "BUY"}
+    cases = [
+        ({**base, "direction": ["BUY"], "order_type": "MARKET"}, "direction"),
+        ({**base, "order_type": {"type": "MARKET"}}, "order_type"),
+        ({**base, "order_type": "MARKET", "time_in_force": ["DAY"]}, "time_in_force"),
+    ]
+
+    for order, field in cases:
+        result = validate_order(order)
+        assert not result.is_valid
+        assert any(error.field == field for error in result.errors)
+        assert validate_orders([order])[0] == result
@@ -0,0 +1,71 @@
+from datetime import datetime
+
+import pytest
+
+from trading_execution_engine.execution.paper_trader import PaperTrader
+
+SIGNALS = [
+    {"symbol": "TCS", "action": "buy", "quantity": 10, "price": 3500.0},
+    {"symbol": "INFY", "action": "BUY", "quantity": 0, "price": 1500.0},
+    {"symbol": "TCS", "action": "SELL", "quantity": 4, "price": 3600.0},
+    {"symbol": "", "action": "BUY", "quantity": 1, "price": 100.0},
+    {"symbol": "INFY", "action": "HOLD", "quantity": 5, "price": 1500.0},
+    {"symbol": "RELIANCE", "action": "BUY", "quantity": 400, "price": 2500.0},
+    {"symbol": "INFY", "action": "BUY", "quantity": 20, "price": 1500.0},
+    {"symbol": "INFY", "action": "SELL", "quantity": 20, "price": 1480.0},
+]
+
+
+def _without_timestamps(trades):
+    return [
+        {k: v for k, v in t.items() if k not in ("timestamp", "timestamp_ns")}
+        for t in trades
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_signals_batch_matches_sequential():
+    """Batch execution fills exactly like executing signals one by one."""
+    config = {"initial_capital": 100000}
+
+    sequential = PaperTrader(config)
+    batched = PaperTrader(config)
+
+    expected = [await sequential.execute_signal(s) for s in SIGNALS]
+    actual = await batched.execute_signals_batch(SIGNALS)
+
+    assert actual == expected
+    # Invalid parameters and insufficient capital are rejected, not filled
+    assert [r["executed"] for r in actual] == [
+        True,
+        False,
+        True,
+        False,
+        False,
+        False,
+        True,
+        True,
+    ]
+    # ISO timestamps are formatted on first read, before any export
+    assert (
+        batched.trades[0]["timestamp"]
+        == datetime.fromtimestamp(batched.trades[0]["timestamp_ns"] / 1e9).isoformat()
+    )
+    assert batched.available_capital == sequential.available_capital
+    assert batched.daily_pnl == sequential.daily_pnl
+    assert _without_timestamps(batched.trades) == _without_timestamps(sequential.trades)
+
+
+@pytest.mark.asyncio
+async def test_close_daily_session_aggregates():
+    """Session summary counts and totals come from the columnar trade buffer."""
+    trader = PaperTrader({"initial_capital": 100000, "commission_per_trade": 20})
+
+    await trader.initialize_daily_session()
+    await trader.execute_signals_batch(SIGNALS)
+    summary = await trader.close_daily_session()
+
+    assert summary["total_trades"] == 4
+    assert summary["buy_trades"] == 2
+    assert summary["sell_trades"] == 2
+    assert summary["total_commission"] == 80
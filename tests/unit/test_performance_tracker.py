@@ -0,0 +1,42 @@
+import pytest
+
+from trading_execution_engine.monitoring.performance_tracker import (
+    ExecutionPerformanceTracker,
+)
+
+
+@pytest.mark.asyncio
+async def test_daily_report_analytics():
+    """Strategy/symbol groupings and execution totals come out of the report."""
+    tracker = ExecutionPerformanceTracker({})
+    signals = [
+        ("momentum", "TCS", 500.0),
+        ("momentum", "INFY", -200.0),
+        ("reversion", "TCS", 100.0),
+    ]
+
+    await tracker.start_daily_session()
+    for strategy, symbol, pnl in signals:
+        tracker.track_signal(
+            {"strategy": strategy, "symbol": symbol},
+            {"paper_result": {"executed": True, "pnl": pnl}},
+        )
+        tracker.track_execution(
+            {"slippage": 10.0, "commission": 20.0, "execution_time_ms": 3.0}
+        )
+    report = await tracker.generate_daily_report()
+    analytics = report["analytics"]
+
+    assert analytics["strategy_performance"] == {
+        "momentum": {"count": 2, "pnl": 300.0},
+        "reversion": {"count": 1, "pnl": 100.0},
+    }
+    assert analytics["symbol_performance"] == {
+        "TCS": {"count": 2, "pnl": 600.0},
+        "INFY": {"count": 1, "pnl": -200.0},
+    }
+    assert analytics["execution_analytics"]["total_executions"] == 3
+    assert analytics["execution_analytics"]["total_commission"] == 60.0
+    assert analytics["execution_analytics"]["avg_slippage_per_trade"] == 10.0
+    assert report["summary"]["signals_received"] == 3
+    assert report["summary"]["success_rate"] == 2 / 3
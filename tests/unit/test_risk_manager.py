@@ -0,0 +1,39 @@
+import pytest
+
+from trading_execution_engine.risk.manager import RiskManager
+
+
+def test_position_metrics_follow_updates():
+    """Exposure metrics reflect the columnar position book."""
+    manager = RiskManager({"total_capital": 1000000})
+
+    manager.reset_daily_limits()
+    manager.update_position("TCS", "BUY", 10, 3500.0)
+    manager.update_position("TCS", "buy", 10, 3700.0)
+    manager.update_position("INFY", "BUY", 20, 1500.0)
+    manager.update_position("INFY", "SELL", 20, 1480.0)
+    manager.update_position("RELIANCE", "BUY", 4, 2500.0)
+    summary = manager.generate_daily_summary()
+
+    assert summary["current_positions"] == {
+        "TCS": {"quantity": 20, "avg_price": 3600.0, "value": 72000.0},
+        "INFY": {"quantity": 0, "avg_price": 0.0, "value": 0.0},
+        "RELIANCE": {"quantity": 4, "avg_price": 2500.0, "value": 10000.0},
+    }
+    assert summary["risk_metrics"]["max_position_utilization_pct"] == 144.0
+    assert summary["risk_metrics"]["concentration_risk_pct"] == pytest.approx(7.2)
+    assert manager.get_available_buying_power() == 918000.0
+
+
+def test_fractional_quantities_are_kept():
+    """Fractional position sizes are stored exactly, not truncated."""
+    manager = RiskManager({"total_capital": 1000000})
+
+    manager.update_position("BTC", "BUY", 2.5, 100.0)
+    manager.update_position("BTC", "SELL", 1, 100.0)
+
+    assert manager.current_positions["BTC"] == {
+        "quantity": 1.5,
+        "avg_price": 100.0,
+        "value": 150.0,
+    }
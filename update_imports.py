@@ -3,30 +3,44 @@
 Helper script to update import statements in Python files.
 Usage: python update_imports.py <directory>
 """
+import mmap
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# Compiled once; "from" and "import" forms are rewritten in a single pass
+_PACKAGE_IMPORT = re.compile(r"(from|import) ai_trading_machine\.(\w+)")
+_SHARED_IMPORT = re.compile(
+    r"from trading_execution_engine\.utils\.(logger|error_handling|config_parser)"
+)
+
+
+def _needs_rewrite(file_path):
+    """Cheap byte scan so files without old import paths skip the regexes"""
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return (
+                data.find(b"ai_trading_machine") != -1
+                or data.find(b"trading_execution_engine.utils") != -1
+            )
 
 
 def update_imports(file_path):
+    if not _needs_rewrite(file_path):
+        return False
+
     with open(file_path, "r") as file:
         content = file.read()
 
     # Update import statements
-    updated_content = re.sub(
-        r"from ai_trading_machine\.(\w+)", r"from trading_execution_engine.\1", content
-    )
-    updated_content = re.sub(
-        r"import ai_trading_machine\.(\w+)",
-        r"import trading_execution_engine.\1",
-        updated_content,
-    )
+    updated_content = _PACKAGE_IMPORT.sub(r"\1 trading_execution_engine.\2", content)
 
     # Update shared services imports
-    updated_content = re.sub(
-        r"from trading_execution_engine\.utils\.(logger|error_handling|config_parser)",
-        r"from shared_services.utils.\1",
-        updated_content,
+    updated_content = _SHARED_IMPORT.sub(
+        r"from shared_services.utils.\1", updated_content
     )
 
     if content != updated_content:
@@ -37,14 +51,25 @@ def update_imports(file_path):
 
 
 def process_directory(directory):
+    file_paths = [
+        os.path.join(root, file)
+        for root, _, files in os.walk(directory)
+        for file in files
+        if file.endswith(".py")
+    ]
+    if not file_paths:
+        return 0
+
+    # Each file is rewritten independently, so the work spreads across cores
+    workers = os.cpu_count() or 1
+    chunksize = max(1, min(32, len(file_paths) // (workers * 4)))
     updated_files = 0
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(".py"):
-                file_path = os.path.join(root, file)
-                if update_imports(file_path):
-                    updated_files += 1
-                    print(f"Updated imports in {file_path}")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(update_imports, file_paths, chunksize=chunksize)
+        for file_path, updated in zip(file_paths, results):
+            if updated:
+                updated_files += 1
+                print(f"Updated imports in {file_path}")
 
     return updated_files
 